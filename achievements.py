@@ -0,0 +1,103 @@
+'''
+Module Name: achievements.py
+Purpose: Data driven achievements kept sorted by threshold per metric, so an update only looks at the achievements it unlocks
+Inputs: data/achievements.json
+Output: None
+Additional code sources: https://docs.python.org/3/library/bisect.html
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import bisect
+import json
+import os
+
+ACHIEVEMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "achievements.json")
+METRICS = ("cookies", "clicks", "buildings", "prestige", "cps")
+
+# reads the achievement table, returns a list of dicts with name, description, metric and threshold
+def load_achievements(path=ACHIEVEMENTS_FILE):
+    with open(path, 'r') as file:
+        entries = json.load(file)["achievements"]
+    names = set()
+    for entry in entries:
+        if entry["metric"] not in METRICS:
+            raise ValueError(f"achievement {entry['name']!r} has unknown metric {entry['metric']!r}")
+        if entry["name"] in names:
+            raise ValueError(f"achievement {entry['name']!r} is listed twice")
+        names.add(entry["name"])
+    return entries
+
+# Class that unlocks achievements as the player's metrics grow
+# per metric the achievements are sorted by threshold and a pointer marks the first one still locked,
+# so an update is one comparison when nothing unlocks and a bisect plus the unlocked ones when something does
+class AchievementManager:
+    def __init__(self, path=ACHIEVEMENTS_FILE):
+        entries = load_achievements(path)
+        # name -> {"description", "achieved"}, the state that is saved and drawn, in the order of the data file
+        self.achievements = {entry["name"]: {"description": entry["description"], "achieved": False} for entry in entries}
+        self.thresholds = {metric: [] for metric in METRICS} # metric -> sorted thresholds
+        self.names = {metric: [] for metric in METRICS} # metric -> achievement names in the same order
+        for entry in sorted(entries, key=lambda entry: entry["threshold"]):
+            self.thresholds[entry["metric"]].append(entry["threshold"])
+            self.names[entry["metric"]].append(entry["name"])
+        self.next_locked = {metric: 0 for metric in METRICS} # index of the first locked achievement per metric
+        self.notifications = []  # List to store active notifications
+
+    def update(self, metric, value):
+        """Unlocks every achievement of metric whose threshold value has reached, returns their names."""
+        start = self.next_locked[metric]
+        thresholds = self.thresholds[metric]
+        if start >= len(thresholds) or value < thresholds[start]:
+            return []
+        end = bisect.bisect_right(thresholds, value, start)
+        unlocked = []
+        for name in self.names[metric][start:end]:
+            data = self.achievements[name]
+            if not data["achieved"]:
+                data["achieved"] = True
+                unlocked.append(name)
+                self.notifications.append(f"Achievement Unlocked: {name}!")
+                print(f"{name} achievement unlocked!")  # Debug print
+        self._advance(metric, end)
+        return unlocked
+
+    # moves the pointer past achievements that are already unlocked, e.g. ones restored from a save
+    def _advance(self, metric, index):
+        names = self.names[metric]
+        while index < len(names) and self.achievements[names[index]]["achieved"]:
+            index += 1
+        self.next_locked[metric] = index
+
+    def update_all(self, ui_manager):
+        """Checks every metric against the current game state, used after loading or buying."""
+        self.update("cookies", ui_manager.cookie_count)
+        self.update("cps", ui_manager.cookies_per_second())
+        self.update("buildings", sum(item.purchased_count for item in ui_manager.shop_items.values() if item.cps))
+        analytics = getattr(ui_manager, "analytics", None)
+        if analytics is not None:
+            self.update("clicks", analytics.clicks)
+        prestige = getattr(ui_manager, "prestige", None)
+        if prestige is not None:
+            self.update("prestige", prestige.prestige_count)
+
+    def state(self):
+        """Returns name -> unlocked for the save file."""
+        return {name: data["achieved"] for name, data in self.achievements.items()}
+
+    def load_state(self, flags):
+        """Restores the unlocked flags from a save, achievements the save does not mention start locked."""
+        for name, data in self.achievements.items():
+            data["achieved"] = bool(flags.get(name, False))
+        for metric in METRICS:
+            self._advance(metric, 0)
+
+    def unlocked_count(self):
+        return sum(1 for data in self.achievements.values() if data["achieved"])
+
+    def get_notifications(self):
+        return self.notifications
+
+    def clear_notifications(self):
+        self.notifications.clear()
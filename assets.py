@@ -0,0 +1,203 @@
+'''
+Module Name: assets.py
+Purpose: Shared caches for image assets so each file is decoded, converted, scaled and rotated only once, small sprites are cut from the atlas written by pack_assets.py
+Inputs: data/assets.json, data/atlas.json
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import json
+import os
+import pygame
+
+from loader import asset_loader
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_FILE = os.path.join(ROOT, "data", "assets.json")
+
+# turns a path as the game spells it ("./assets/cookie.png", "assets/cookie.png") into the key used by the
+# manifest and the atlas layout, relative to the repository root with forward slashes
+def asset_key(path):
+    return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, "/")
+
+# reads the asset manifest, returns its atlas settings, packed patterns and lazily loaded files
+def load_manifest(path=MANIFEST_FILE):
+    with open(path, 'r') as file:
+        manifest = json.load(file)
+    for field in ("image", "layout"):
+        if field not in manifest["atlas"]:
+            raise ValueError(f"{path} atlas needs an {field!r}")
+    return manifest
+
+# Class for the packed sprite sheet's layout, the page itself is loaded through the asset cache like any other file
+class SpriteAtlas:
+    def __init__(self, image_path, rects):
+        self.image_path = image_path
+        self.rects = rects # asset key -> (x, y, width, height) on the page
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def get(self, key, page):
+        """Returns the sprite for key as a subsurface of the page, so it shares the page's pixels."""
+        return page.subsurface(pygame.Rect(self.rects[key]))
+
+# reads the layout written by pack_assets.py, returns None when the atlas has not been packed so every sprite loads on its own
+def load_atlas(manifest_path=MANIFEST_FILE):
+    if not os.path.exists(manifest_path):
+        return None
+    atlas = load_manifest(manifest_path)["atlas"]
+    layout_path = os.path.join(ROOT, atlas["layout"])
+    image_path = os.path.join(ROOT, atlas["image"])
+    if not os.path.exists(layout_path) or not os.path.exists(image_path):
+        return None
+    with open(layout_path, 'r') as file:
+        layout = json.load(file)
+    return SpriteAtlas(image_path, {key: tuple(entry["rect"]) for key, entry in layout["sprites"].items()})
+
+# Class for caching loaded image surfaces, keyed by (path, size)
+class AssetCache:
+    def __init__(self, atlas=None, loader=None):
+        self.atlas = atlas # SpriteAtlas for the packed sprites, None to load every file on its own
+        self.loader = loader # AssetLoader that preload queues files on, None to decode them when first used
+        self.files = {} # asset key -> decoded and converted image file, an atlas page or a standalone image
+        self.sources = {} # path -> surface at its original size, a file or a sprite cut from the atlas
+        self.surfaces = {} # (path, size) -> scaled surface
+        self.hits = 0 # number of lookups served from the cache
+        self.misses = 0 # number of lookups that had to decode or scale
+
+    # maps a path to the file holding its pixels, the atlas page for packed sprites
+    def _file_path(self, path):
+        if self.atlas is not None and asset_key(path) in self.atlas:
+            return self.atlas.image_path
+        return path
+
+    # converts a decoded file to the display's pixel format when a display exists, runs on the main thread
+    def _adopt(self, key, surface):
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.files[key] = surface
+
+    # returns a decoded file, waiting for the loader if it is already decoding it so no file is decoded twice
+    def _file(self, path):
+        key = asset_key(path)
+        surface = self.files.get(key)
+        if surface is None:
+            if self.loader is not None and self.loader.pending(("image", key)):
+                self.loader.wait(("image", key))
+            else:
+                self._adopt(key, pygame.image.load(path))
+            surface = self.files[key]
+        return surface
+
+    def _source(self, path):
+        surface = self.sources.get(path)
+        if surface is None:
+            key = asset_key(path)
+            if self.atlas is not None and key in self.atlas:
+                surface = self.atlas.get(key, self._file(self.atlas.image_path))
+            else:
+                surface = self._file(path)
+            self.sources[path] = surface
+        return surface
+
+    def preload(self, paths):
+        """Starts decoding the files behind paths on the loader's threads, packed sprites queue their atlas page once."""
+        if self.loader is None:
+            return
+        for path in paths:
+            file_path = self._file_path(path)
+            key = asset_key(file_path)
+            if key not in self.files:
+                self.loader.image(key, file_path, lambda surface, key=key: self._adopt(key, surface))
+
+    def load(self, path, size=None):
+        """Returns the surface for path scaled to size (width, height), or at its original size if size is None."""
+        key = (path, None if size is None else (int(size[0]), int(size[1])))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._source(path)
+        if key[1] is not None:
+            surface = pygame.transform.scale(surface, key[1])
+        self.surfaces[key] = surface
+        return surface
+
+    def invalidate(self):
+        """Drops every scaled surface, used when the window is resized. Decoded sources are kept."""
+        self.surfaces.clear()
+
+    def clear(self):
+        """Drops everything, including the decoded files."""
+        self.surfaces.clear()
+        self.sources.clear()
+        self.files.clear()
+
+    def stats(self):
+        """Returns the hit/miss counters and the number of cached surfaces."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.surfaces), "sources": len(self.sources),
+                "files": len(self.files)}
+
+# process-wide cache shared by the buttons, cookie, cursor and backgrounds
+asset_cache = AssetCache(load_atlas(), asset_loader)
+
+# gets an image from the shared cache
+def load_image(path, size=None):
+    return asset_cache.load(path, size)
+
+# Class for pre-rendered rotation frames of a surface so spinning sprites only need a blit
+# frames are cropped to their visible pixels, the step count is the largest divisor of the requested steps whose frames
+# all fit in the memory cap, so after the first turn every angle is a blit and nothing is rotated while drawing
+class RotationAtlas:
+    def __init__(self, surface, steps=360, memory_cap=64 * 1024 * 1024):
+        self.surface = surface
+        self.memory_cap = memory_cap
+        # the frame at 45 degrees has the largest bounds, it sizes the budget for the others
+        self.frame_bytes = self._bytes(self._crop(pygame.transform.rotate(surface, 45)))
+        steps = max(1, int(steps))
+        fitting = [count for count in range(1, steps + 1) if steps % count == 0 and count * self.frame_bytes <= memory_cap]
+        self.steps = max(fitting, default=1) # number of angles actually rendered, a divisor so they stay evenly spaced
+        self.frames = [None] * self.steps # rendered lazily on first use
+        self.rendered = 0
+        self.kept_bytes = 0
+
+    def _bytes(self, frame):
+        return frame.get_width() * frame.get_height() * frame.get_bytesize()
+
+    # maps an angle in degrees to the nearest rendered step
+    def frame_index(self, angle):
+        return int(round((angle % 360) * self.steps / 360.0)) % self.steps
+
+    # crops the transparent border of a rotated frame, keeping it centred on the same point
+    def _crop(self, frame):
+        visible = frame.get_bounding_rect()
+        center_x, center_y = frame.get_width() // 2, frame.get_height() // 2
+        half_width = max(center_x - visible.left, visible.right - center_x)
+        half_height = max(center_y - visible.top, visible.bottom - center_y)
+        crop = pygame.Rect(center_x - half_width, center_y - half_height, 2 * half_width, 2 * half_height).clip(frame.get_rect())
+        return frame.subsurface(crop).copy()
+
+    def get(self, angle):
+        """Returns the rotated surface closest to angle, rendering it the first time it is needed."""
+        index = self.frame_index(angle)
+        frame = self.frames[index]
+        if frame is None:
+            frame = self._crop(pygame.transform.rotate(self.surface, index * 360.0 / self.steps))
+            self.frames[index] = frame
+            self.kept_bytes += self._bytes(frame)
+            self.rendered += 1
+        return frame
+
+    def prerender(self):
+        """Renders every step up front instead of on first use."""
+        for index in range(self.steps):
+            self.get(index * 360.0 / self.steps)
+
+    def memory_bytes(self):
+        """Returns the number of bytes held by the rendered frames."""
+        return self.kept_bytes
@@ -0,0 +1,86 @@
+'''
+Module Name: autosave.py
+Purpose: Saves the game on an interval and shortly after purchases, prestige and gambling, skipping saves when nothing changed
+Inputs: None
+Output: Save files written through save_writer.py
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import hashlib
+import time
+
+from save_format import encode
+from save_game import snapshot
+from save_writer import save_writer
+from save_slots import slot_manager
+
+AUTOSAVE_INTERVAL = 30.0 # seconds between saves while playing
+COALESCE_DELAY = 2.0 # seconds after the first event of a burst before the save runs, later events in the burst join it
+
+# Class that decides when to save, the state is captured on the main thread and encoded, hashed and written on the writer thread
+class Autosave:
+    def __init__(self, writer=save_writer, interval=AUTOSAVE_INTERVAL, coalesce_delay=COALESCE_DELAY):
+        self.writer = writer
+        self.interval = interval
+        self.coalesce_delay = coalesce_delay
+        self.enabled = True
+        self.last_save_time = time.monotonic()
+        self.pending_since = None # time of the first event not saved yet, None when nothing is pending
+        self.pending_reasons = set()
+        self.last_digest = {} # save path -> hash of the last state written there
+        # metrics, updated on the writer thread
+        self.last_duration = 0.0 # seconds spent encoding and writing the last save
+        self.bytes_written = 0
+        self.saves_written = 0
+        self.saves_skipped = 0
+
+    def notify(self, reason):
+        """Asks for a save soon, e.g. after a purchase. Bursts of events within the coalesce delay share one save."""
+        if self.pending_since is None:
+            self.pending_since = time.monotonic()
+        self.pending_reasons.add(reason)
+
+    def update(self, ui_manager, now=None):
+        """Called once per frame, saves if an event is waiting or the interval has passed. Returns True if a save was queued."""
+        if not self.enabled or ui_manager.selected_save is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        event_due = self.pending_since is not None and now - self.pending_since >= self.coalesce_delay
+        if not event_due and now - self.last_save_time < self.interval:
+            return False
+        self.save_now(ui_manager, now)
+        return True
+
+    def save_now(self, ui_manager, now=None, force=False):
+        """Queues a save of the current state right away, force writes it even if it matches the last state saved there."""
+        self.last_save_time = time.monotonic() if now is None else now
+        self.pending_since = None
+        self.pending_reasons.clear()
+        state = snapshot(ui_manager) # plain values, safe to hand to the writer thread
+        path = ui_manager.selected_save
+        self.writer.submit_call(lambda: self._write(path, state, force))
+        slot_manager.record(path, ui_manager)
+
+    # runs on the writer thread
+    def _write(self, path, state, force=False):
+        start = time.perf_counter()
+        # the timestamp is left out of the hash, if nothing else changed the CPS is 0 so the old timestamp gives the same offline bonus
+        digest = hashlib.blake2b(encode(dict(state, timestamp=0.0)), digest_size=16).digest()
+        if not force and self.last_digest.get(path) == digest:
+            self.saves_skipped += 1
+            return
+        data = encode(state)
+        self.writer.write_snapshot(path, data)
+        self.last_digest[path] = digest
+        self.bytes_written += len(data)
+        self.saves_written += 1
+        self.last_duration = time.perf_counter() - start
+
+    def stats(self):
+        return {"last_duration": self.last_duration, "bytes_written": self.bytes_written, "saves_written": self.saves_written, "saves_skipped": self.saves_skipped}
+
+autosave = Autosave()
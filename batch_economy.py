@@ -0,0 +1,97 @@
+'''
+Module Name: batch_economy.py
+Purpose: Evaluates many player states or build orders against the shop catalog at once with NumPy arrays
+Inputs: None
+Output: None
+Additional code sources: https://numpy.org/doc/stable/user/basics.broadcasting.html
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import numpy as np
+
+from pricing import PRICE_GROWTH
+
+# Class holding n_states player states as arrays of shape (n_states, n_items)
+# Prices and CPS are computed with the same floating point operations, in the same order, as
+# pricing.unit_price and Economy.compute_cookies_per_second, so the results match the scalar path exactly.
+class BatchEconomy:
+    def __init__(self, items, n_states, prestige_items=()):
+        items = list(items)
+        self.names = [item.name for item in items]
+        self.base_cost = np.array([item.base_cost for item in items], dtype=np.float64)
+        self.cost_step = np.array([item.cost_step for item in items], dtype=np.float64)
+        self.item_cps = np.array([item.cps if item.cps is not None else 0.0 for item in items], dtype=np.float64)
+        self.has_cps = np.array([item.cps is not None for item in items])
+        self.counts = np.zeros((n_states, len(items)), dtype=np.int64) # purchased count per state and item
+        self.cookies = np.zeros(n_states, dtype=np.float64) # balance per state
+        prestige_items = list(prestige_items)
+        self.prestige_cps = np.array([item.cps if item.cps is not None else 0.0 for item in prestige_items], dtype=np.float64)
+        self.prestige_counts = np.zeros((n_states, len(prestige_items)), dtype=np.int64)
+        self._growth = np.ones(1, dtype=np.float64) # PRICE_GROWTH ** n for n = 0..len - 1, built with Python floats
+
+    @classmethod
+    def from_catalog(cls, shop_items, shop_upgrades, n_states, prestige=None):
+        """Builds a batch over every shop item and upgrade, in the same order as the game."""
+        prestige_items = [item for key, item in prestige.get_shop_items()] if prestige is not None else ()
+        return cls(list(shop_items.values()) + list(shop_upgrades.values()), n_states, prestige_items)
+
+    # powers of the growth rate come from a table built with Python's float pow, so they are bit for bit
+    # the values pricing.unit_price uses (numpy's pow can differ in the last place)
+    def _growth_table(self, max_count):
+        if max_count >= len(self._growth):
+            self._growth = np.array([PRICE_GROWTH ** n for n in range(max_count + 1)], dtype=np.float64)
+        return self._growth
+
+    def prices(self):
+        """Returns the price of the next unit of every item for every state, shape (n_states, n_items)."""
+        counts = self.counts
+        growth = self._growth_table(int(counts.max(initial=0)))
+        return np.floor((self.base_cost + self.cost_step * counts) * growth[counts])
+
+    def affordable(self, prices=None):
+        """Returns a boolean mask of the items each state can buy right now."""
+        if prices is None:
+            prices = self.prices()
+        return self.cookies[:, None] >= prices
+
+    def cookies_per_second(self):
+        """Returns the CPS of every state, summed item by item in catalog order like the scalar path."""
+        total = np.zeros(len(self.cookies), dtype=np.float64)
+        for column in np.flatnonzero(self.has_cps):
+            total = total + self.item_cps[column] * self.counts[:, column]
+        if len(self.prestige_cps):
+            prestige_total = np.zeros(len(self.cookies), dtype=np.float64)
+            for column in range(len(self.prestige_cps)):
+                prestige_total = prestige_total + self.prestige_cps[column] * self.prestige_counts[:, column]
+            total = total + prestige_total
+        return total
+
+    def next_best_purchase(self, prices=None):
+        """Returns, per state, the index of the building with the lowest price per extra CPS (-1 if none) and whether it is affordable now."""
+        if prices is None:
+            prices = self.prices()
+        payback = np.where(self.item_cps > 0, prices / np.where(self.item_cps > 0, self.item_cps, 1.0), np.inf)
+        best = np.argmin(payback, axis=1)
+        rows = np.arange(len(best))
+        has_option = np.isfinite(payback[rows, best])
+        best = np.where(has_option, best, -1)
+        affordable = has_option & (self.cookies >= prices[rows, np.maximum(best, 0)])
+        return best, affordable
+
+    def buy(self, choices, prices=None):
+        """Buys one unit of choices[state] for every state that can afford it (-1 skips the state). Returns the mask of states that bought."""
+        if prices is None:
+            prices = self.prices()
+        rows = np.arange(len(choices))
+        columns = np.maximum(choices, 0)
+        price = prices[rows, columns]
+        bought = (choices >= 0) & (self.cookies >= price)
+        self.cookies = np.where(bought, self.cookies - price, self.cookies)
+        np.add.at(self.counts, (rows[bought], columns[bought]), 1)
+        return bought
+
+    def advance(self, seconds):
+        """Credits seconds of production to every state."""
+        self.cookies = self.cookies + self.cookies_per_second() * seconds
@@ -0,0 +1,92 @@
+'''
+Module Name: bench_batch.py
+Purpose: Benchmarks the NumPy batch evaluator against the scalar Economy path and checks they agree exactly
+Inputs: Number of states (optional, default 10000)
+Output: Timings printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from batch_economy import BatchEconomy
+from economy import Economy
+from pricing import item_price
+from prestige import Prestige_Shop
+from shop import shop_items, shop_upgrades
+
+# builds random player states, the same ones for both paths
+def random_states(n_states, n_items, n_prestige, seed=1):
+    rng = random.Random(seed)
+    counts = [[rng.randint(0, 200) for _ in range(n_items)] for _ in range(n_states)]
+    prestige_counts = [[rng.randint(0, 3) for _ in range(n_prestige)] for _ in range(n_states)]
+    cookies = [rng.random() * 10 ** rng.uniform(0, 9) for _ in range(n_states)]
+    return counts, prestige_counts, cookies
+
+# evaluates every state one at a time with the game's own code
+def scalar_path(counts, prestige_counts, cookies):
+    prestige = Prestige_Shop()
+    economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades), prestige)
+    items = list(economy.shop_items.values()) + list(economy.shop_upgrades.values())
+    prestige_items = [item for key, item in prestige.get_shop_items()]
+    all_prices, all_cps, all_affordable = [], [], []
+    for state_counts, state_prestige, balance in zip(counts, prestige_counts, cookies):
+        for item, count in zip(items, state_counts):
+            item.purchased_count = count
+        for item, count in zip(prestige_items, state_prestige):
+            item.purchased_count = count
+        economy.refresh_rates()
+        prices = [item_price(item) for item in items]
+        all_prices.append(prices)
+        all_cps.append(economy.cookies_per_second())
+        all_affordable.append([balance >= price for price in prices])
+    return all_prices, all_cps, all_affordable
+
+# loads the states into a batch evaluator, not timed since the states would normally be generated as arrays
+def batch_setup(counts, prestige_counts, cookies):
+    batch = BatchEconomy.from_catalog(shop_items, shop_upgrades, len(counts), Prestige_Shop())
+    batch.counts[:] = counts
+    batch.prestige_counts[:] = prestige_counts
+    batch.cookies[:] = cookies
+    return batch
+
+# evaluates every state at once with the batch evaluator
+def batch_path(batch):
+    prices = batch.prices()
+    return prices, batch.cookies_per_second(), batch.affordable(prices), batch.next_best_purchase(prices)
+
+def main():
+    n_states = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_items = len(shop_items) + len(shop_upgrades)
+    counts, prestige_counts, cookies = random_states(n_states, n_items, len(Prestige_Shop().prestige_upgrades))
+
+    start = time.perf_counter()
+    scalar_prices, scalar_cps, scalar_affordable = scalar_path(counts, prestige_counts, cookies)
+    scalar_time = time.perf_counter() - start
+
+    batch = batch_setup(counts, prestige_counts, cookies)
+    start = time.perf_counter()
+    prices, cps, affordable, best = batch_path(batch)
+    batch_time = time.perf_counter() - start
+
+    # the batch path has to reproduce the scalar path exactly, not approximately
+    assert np.array_equal(prices, np.array(scalar_prices, dtype=np.float64)), "prices differ"
+    assert np.array_equal(cps, np.array(scalar_cps, dtype=np.float64)), "cookies per second differs"
+    assert np.array_equal(affordable, np.array(scalar_affordable)), "affordability differs"
+
+    print(f"{n_states} states x {n_items} items")
+    print(f"scalar: {scalar_time * 1000:.1f} ms")
+    print(f"batch:  {batch_time * 1000:.1f} ms ({scalar_time / batch_time:.0f}x faster)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+'''
+Module Name: bench_bignum.py
+Purpose: Benchmarks the tick and purchase paths with the BigNum changes against plain float arithmetic, inside and past the float range
+Inputs: Number of iterations (optional, default 100000)
+Output: Timings printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bignum import BigNum, FLOAT_LIMIT
+from economy import Economy
+from pricing import item_price
+from shop import shop_items, shop_upgrades
+from simulation import SimulationEngine
+
+# the tick as it was before BigNum, cookie_count += cookies_per_second() x dt
+def float_ticks(economy, dt, iterations):
+    for _ in range(iterations):
+        economy.cookie_count = economy.cookie_count + economy.cookies_per_second() * dt
+
+# the game's tick
+def engine_ticks(economy, dt, iterations):
+    engine = SimulationEngine(economy, step=dt)
+    for _ in range(iterations):
+        engine.tick(dt)
+
+# UIManager.buy_item: price the item, compare it with the balance, then pay and apply its effects
+def purchases(economy, item, iterations):
+    for _ in range(iterations):
+        if economy.cookie_count >= item_price(item):
+            economy.apply_purchase(item, 1)
+        item.purchased_count = 0 # keep the price where it was so every iteration does the same work
+
+def new_economy(cookies):
+    economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades))
+    economy.shop_items["Cursor"].purchased_count = 50
+    economy.refresh_rates()
+    economy.cookie_count = cookies
+    return economy
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    huge = BigNum(FLOAT_LIMIT) * 1e50 # a balance plain floats cannot hold
+
+    baseline = new_economy(12345.5)
+    float_time = timed(float_ticks, baseline, 0.1, iterations)
+    hybrid = new_economy(12345.5)
+    hybrid_time = timed(engine_ticks, hybrid, 0.1, iterations)
+    # below FLOAT_LIMIT the engine keeps plain floats, so it has to match the old arithmetic exactly
+    assert hybrid.cookie_count.__class__ is float and hybrid.cookie_count == baseline.cookie_count
+    big = new_economy(huge)
+    big_time = timed(engine_ticks, big, 0.1, iterations)
+    assert big.cookie_count == huge # the CPS is far below one ulp of the balance, the work per tick is the same
+
+    economy = new_economy(1e12)
+    purchase_time = timed(purchases, economy, economy.shop_items["Grandma"], iterations)
+    economy = new_economy(huge)
+    big_purchase_time = timed(purchases, economy, economy.shop_items["Grandma"], iterations)
+
+    def per_op(seconds):
+        return seconds / iterations * 1e9
+    print(f"{iterations} iterations")
+    print(f"tick      float {per_op(float_time):7.1f} ns   engine {per_op(hybrid_time):7.1f} ns ({hybrid_time / float_time:.1f}x)"
+          f"   engine past 1e308 {per_op(big_time):7.1f} ns ({big_time / float_time:.1f}x)")
+    print(f"purchase  engine {per_op(purchase_time):7.1f} ns   past 1e308 {per_op(big_purchase_time):7.1f} ns ({big_purchase_time / purchase_time:.1f}x)")
+    print(f"balance past 1e308 after the ticks: {big.cookie_count:.3e}")
+
+if __name__ == '__main__':
+    main()
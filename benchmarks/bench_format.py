@@ -0,0 +1,91 @@
+'''
+Module Name: bench_format.py
+Purpose: Benchmarks the per-frame number formatting cost of the cached formatter against the old simplify_number
+Inputs: Number of frames (optional, default 3000)
+Output: Timings printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bignum import log10
+from number_format import NumberFormatter, NOTATIONS
+from pricing import item_price
+from shop import shop_items, shop_upgrades
+
+# UIManager.get_suffix and simplify_number as they were, rebuilding the prefix lists on every call
+def old_get_suffix(illion):
+    first_latin_units = ["m", "b", "tr", "quadr", "quint", "sext", "sept", "oct", "non"]
+    n_latin_units = ["un", "duo", "tre", "quattuor", "quin", "se", "septen", "octo", "novem"]
+    latin_tens = ["dec", "vigint", "trigint", "quadragint", "quinquagint", "sexagint", "septuagint", "octogint", "nonagint"]
+    if illion < 10:
+        return f"{first_latin_units[illion-1]}illion"
+    elif illion < 100:
+        digit_list = [int(digit) for digit in str(illion)]
+        if illion % 10 == 0:
+            return f"{latin_tens[digit_list[0]-1]}illion"
+        else:
+            return f"{n_latin_units[digit_list[1]-1]}{latin_tens[digit_list[0]-1]}illion"
+    elif illion == 100:
+        return "centillion"
+
+def old_simplify_number(num):
+    if num < 1_000_000:
+        return f"{num:.1f}"
+    exponent = log10(num)
+    try:
+        suffix_index = int(exponent // 3) - 1
+    except:
+        return "Infinity"
+    if suffix_index > 100:
+        return f"{num:.3e}"
+    scaled_num = num / (10 ** ((suffix_index + 1) * 3))
+    return f"{scaled_num:.3f} {old_get_suffix(suffix_index).capitalize()}"
+
+# the numbers one frame formats: balance and CPS (draw_stats), one price per shop button (draw_shop),
+# balance, CPC and CPS again (draw_analytics) and the click feedback
+def frame_numbers(frame, prices):
+    cookies = 3.7e14 + frame * 41234.5 # the balance changes every frame, the rest only on purchases
+    cps = 412345.25
+    cpc = 98765432.0
+    return [cookies, cps] + prices + [cookies, cpc, cps, cpc]
+
+def run(format_function, frames, prices):
+    start = time.perf_counter()
+    for frame in range(frames):
+        for num in frame_numbers(frame, prices):
+            format_function(num)
+    return time.perf_counter() - start
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    items = copy.deepcopy(shop_items)
+    for count, item in enumerate(items.values()):
+        item.purchased_count = 40 + count * 25
+    prices = [item_price(item) for item in list(items.values()) + list(shop_upgrades.values())]
+    calls = len(frame_numbers(0, prices))
+
+    for frame in range(frames): # the cached formatter must produce the same text as the old code
+        for num in frame_numbers(frame, prices):
+            assert NumberFormatter().format(num) == old_simplify_number(num)
+
+    old_time = run(old_simplify_number, frames, prices)
+    print(f"{frames} frames, {calls} numbers per frame")
+    print(f"old simplify_number     {old_time / frames * 1e6:7.1f} us/frame")
+    for notation in NOTATIONS:
+        formatter = NumberFormatter(notation)
+        new_time = run(formatter.format, frames, prices)
+        stats = formatter.stats()
+        hit_rate = stats["hits"] / (stats["hits"] + stats["misses"])
+        print(f"{notation:11} formatter  {new_time / frames * 1e6:7.1f} us/frame ({old_time / new_time:.1f}x faster, {hit_rate:.0%} cache hits)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''
+Module Name: bench_input.py
+Purpose: Benchmarks hit-testing a click against shop columns of growing size, a linear scan of the buttons against the spatial index,
+         and the game layer's cost per click including refreshing its index while purchases change the buttons shown
+Inputs: Number of clicks per size (optional, default 20000)
+Output: Timings printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pygame
+
+from input_dispatch import GameLayer, SpatialIndex
+
+# the shop column as UIManager.create_buttons lays it out, one button per item
+def shop_column(count, width=1920, height=1080):
+    button_height = int(height * 0.07)
+    pitch = button_height + int(height * 0.01)
+    return [(pygame.Rect(width - int(width * 0.25), int(height * 0.15) + index * pitch, int(width * 0.15), button_height), index)
+            for index in range(count)]
+
+# the parts of Game the game layer indexes: the shop slots, the toolbar buttons and the cookie
+def game_screen(entries):
+    toolbar = SimpleNamespace(rect=pygame.Rect(0, 0, 10, 10))
+    ui_manager = SimpleNamespace(shop_slots=entries, buttons=[], buy_mode_button=toolbar, popup_button=toolbar, prestige_button=toolbar)
+    return SimpleNamespace(ui_manager=ui_manager, cookie=SimpleNamespace(rect=pygame.Rect(0, 0, 10, 10)))
+
+def main():
+    clicks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    print(f"{clicks} clicks per size")
+    for count in (11, 100, 1000, 10000):
+        entries = shop_column(count)
+        bottom = entries[-1][0].bottom
+        points = [(rng.randint(1400, 1800), rng.randint(0, bottom)) for _ in range(clicks)]
+        start = time.perf_counter()
+        index = SpatialIndex(entries)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        indexed = [index.hit(point) for point in points]
+        hit = (time.perf_counter() - start) / clicks
+        start = time.perf_counter()
+        scanned = [next((target for rect, target in entries if rect.collidepoint(point)), None) for point in points]
+        scan = (time.perf_counter() - start) / clicks
+        assert indexed == scanned
+
+        # a click as the game layer sees it: refresh the index, then hit-test, while every click replaces the shown buttons
+        game = game_screen(entries)
+        layer = GameLayer(game)
+        start = time.perf_counter()
+        for point in points:
+            layer._refresh()
+            layer.index.hit(point)
+            game.ui_manager.buttons = [] # buy_item and handle_cookie_click replace the list on every click
+        per_click = (time.perf_counter() - start) / clicks
+        assert layer.builds == 1
+        print(f"{count:6} buttons   linear scan {scan * 1e6:8.2f} us   index {hit * 1e6:5.2f} us   index build {build * 1000:7.2f} ms"
+              f"   per click with refresh {per_click * 1e6:7.2f} us ({layer.builds} build for {clicks} clicks)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+'''
+Module Name: bench_offline.py
+Purpose: Benchmarks offline earnings for short and very long absences, the closed form should cost the same for both
+Inputs: Number of repetitions (optional, default 20000)
+Output: Timings printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from economy import Economy
+from offline import OfflineProgress, ConstantEfficiency, DecayEfficiency, StepEfficiency
+from shop import shop_items, shop_upgrades
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades))
+    economy.shop_items["Grandma"].purchased_count = 25
+    economy.refresh_rates()
+    curves = [("constant", ConstantEfficiency()), ("steps", StepEfficiency([(3600, 1.0), (86400, 0.5)], after=0.1)),
+              ("decay", DecayEfficiency())]
+    absences = [("1 minute", 60), ("1 day", 86400), ("6 months", 182 * 86400)]
+    print(f"{repetitions} repetitions")
+    for curve_name, curve in curves:
+        offline = OfflineProgress(cap=None, curve=curve, clicks_per_second=1, simulate_events=True)
+        timings = []
+        for _, seconds in absences:
+            start = time.perf_counter()
+            for _ in range(repetitions):
+                economy.cookie_count = 0
+                offline.credit(economy, seconds)
+            timings.append(f"{(time.perf_counter() - start) / repetitions * 1e6:6.2f} us")
+        print(f"{curve_name:9}" + "".join(f"   {label}: {timing}" for (label, _), timing in zip(absences, timings)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+'''
+Module Name: bench_simulator.py
+Purpose: Benchmarks the headless simulator with and without the game's random events, and checks what a run does and does not model
+Inputs: Hours of play per run (optional, default 8)
+Output: Timings and run summaries printed to the console
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from simulator import Simulator, best_payback_policy
+
+def run(hours, **options):
+    simulator = Simulator(clicks_per_second=1, **options)
+    start = time.perf_counter()
+    result = simulator.run(hours, best_payback_policy)
+    return simulator, result, time.perf_counter() - start
+
+def main():
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    for label, options in [("no events", {"events": False}), ("events", {"seed": 0}), ("events, gambling", {"seed": 0, "gamble": True})]:
+        simulator, result, elapsed = run(hours, **options)
+        print(f"{label:17} {len(result.purchases):5} purchases {result.events:5} events {float(result.cookies[-1]):12.4g} cookies"
+              f" {float(result.cps[-1]):10.1f} CPS   {elapsed * 1000:7.1f} ms")
+        # prestiging is a player decision the simulator leaves out, a run never changes the prestige level it started with
+        assert simulator.economy.prestige.prestige_count == 0 and simulator.economy.prestige.golden_cookies == 0
+        assert (result.events > 0) == options.get("events", True)
+
+    # the events are seeded, so the same seed gives the same run
+    first, second = run(hours, seed=0)[1], run(hours, seed=0)[1]
+    assert first.purchases == second.purchases and first.cookies == second.cookies
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+'''
+Module Name: bench_startup.py
+Purpose: Benchmarks time to first frame, loading every packed sprite with the atlas and with each sprite from its own file,
+         and the cost of a window resize against rebuilding the UI from disk
+Inputs: Number of runs per mode (optional, default 5), each run is a fresh process so nothing is cached between runs,
+        run as root on Linux to also drop the OS file cache before each run
+Output: Timings printed to the console
+Additional code sources: https://docs.python.org/3/library/subprocess.html
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import time
+START = time.perf_counter() # taken before pygame and the game modules are imported
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DROP_CACHES = "/proc/sys/vm/drop_caches"
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# Class for stopping Game.run once the first frame has been presented
+class FirstFrame(Exception):
+    pass
+
+# Class standing in for pygame's clock, its tick comes right after the frame is pushed to the display
+class StopClock:
+    def tick(self, fps):
+        raise FirstFrame
+
+# starts the game in this process and prints its timings as JSON, mode is "atlas" or "files"
+def child(mode):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # runs without a window or sound card
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(ROOT) # the game loads its assets relative to the repository root
+    import pygame
+    import game
+    from assets import asset_cache, load_manifest
+    if mode == "files":
+        asset_cache.atlas = None
+    imported = time.perf_counter()
+    instance = game.Game(seed=0)
+    constructed = time.perf_counter()
+    instance.clock = StopClock()
+    try:
+        instance.run()
+    except FirstFrame:
+        pass
+    first_frame = time.perf_counter()
+
+    files = asset_cache.stats()["files"] # image files read before the first frame, lazy loading keeps this small in both modes
+
+    # every sprite the atlas packs, as the game needs them once it is past the main menu
+    # this is where the atlas differs: one page read and decoded instead of one file per sprite
+    from pack_assets import packed_keys
+    keys = packed_keys(load_manifest())
+    start = time.perf_counter()
+    for key in keys:
+        asset_cache.load(key)
+    sprites = time.perf_counter() - start
+    sprite_files = asset_cache.stats()["files"] - files
+
+    # a resize as the game handles it now, then the rebuild it used to do, which read the images from disk again
+    pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, w=800, h=600, size=(800, 600)))
+    start = time.perf_counter()
+    instance.handle_events()
+    resize = time.perf_counter() - start
+    asset_cache.clear()
+    start = time.perf_counter()
+    game.UIManager(instance.achievement_manager, instance.prestige, instance.renderer)
+    game.Cookie(f"{game.ASSETS_FILEPATH}/cookie.png", 0.2, 800, 600)
+    game.load_image(game.GAME_BACKGROUND, (800, 600))
+    rebuild = time.perf_counter() - start
+
+    print(json.dumps({"import": imported - START, "init": constructed - imported, "first_frame": first_frame - START,
+                      "sprites": sprites, "resize": resize, "rebuild": rebuild, "files": files, "sprite_files": sprite_files}))
+
+# empties the OS file cache so the next run reads the images from disk, returns False where that is not allowed
+def drop_caches():
+    try:
+        os.sync()
+        with open(DROP_CACHES, 'w') as file:
+            file.write("3")
+        return True
+    except OSError:
+        return False
+
+# runs each mode in fresh processes and prints the median of each timing
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cold = drop_caches()
+    print(f"{runs} runs per mode, times in ms, OS file cache {'dropped before each run' if cold else 'warm (not root, could not drop it)'}")
+    for mode in ("atlas", "files"):
+        results = []
+        for _ in range(runs):
+            if cold:
+                drop_caches()
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode],
+                                    capture_output=True, text=True, check=True).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+        median = {key: statistics.median(result[key] for result in results) * 1000
+                  for key in ("import", "init", "first_frame", "sprites", "resize", "rebuild")}
+        print(f"{mode:6} import {median['import']:7.1f}   Game() {median['init']:6.1f}   first frame {median['first_frame']:7.1f}"
+              f" ({results[-1]['files']} image files)   all packed sprites {median['sprites']:6.2f} ({results[-1]['sprite_files']} files)"
+              f"   resize {median['resize']:5.2f} (rebuilding the UI from disk {median['rebuild']:6.2f})")
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,396 @@
+'''
+Module Name: bignum.py
+Purpose: Number type for cookie counts, prices and rates that keeps going past the float limit of about 1e308
+Inputs: None
+Output: None
+Additional code sources: https://docs.python.org/3/library/math.html#math.frexp
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import decimal
+import math
+import re
+import sys
+
+_frexp = math.frexp
+_ldexp = math.ldexp
+_LOG10_2 = math.log10(2)
+_LN_2 = math.log(2)
+# past this many binary places the smaller operand of an add is below half an ulp of the larger and cannot change it
+_ADD_CUTOFF = 55
+_PRECISION = re.compile(r"\.(\d+)")
+_REPR = re.compile(r"BigNum\(\s*([^,\s]+)\s*,\s*(-?\d+)\s*\)")
+_DIGITS = 17 # significant digits str() prints past the float range, always enough to read the same mantissa back
+_WORKING_PRECISION = 60 # decimal digits for conversions past the float range, far more than the 17 that are kept
+_TWO = decimal.Decimal(2)
+# values below this stay plain floats, so everyday arithmetic runs at native speed, and adding two of them
+# or scaling one by up to 1e8 cannot overflow before fit() gets to promote the result
+FLOAT_LIMIT = 1e300
+_BIG_EXPONENT = math.frexp(FLOAT_LIMIT)[1] # binary exponent of FLOAT_LIMIT
+
+def _make(m, e):
+    number = object.__new__(BigNum)
+    number.m = m
+    number.e = e
+    return number
+
+def _normalized(m, e):
+    fm, fe = _frexp(m)
+    if fm == 0.0:
+        return ZERO
+    return _make(fm, e + fe)
+
+# decimal context for conversions past the float range, the exponent limits are lifted so only the precision applies
+def _decimal_context():
+    return decimal.Context(prec=_WORKING_PRECISION, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+# rounds a finite Decimal to the nearest BigNum, the mantissa is rounded once, from an exact enough scaled value
+def _from_decimal(value):
+    if value.is_zero():
+        return ZERO
+    context = _decimal_context()
+    exponent = int(value.adjusted() * 3.321928094887362) # log2(10), a first guess at the binary exponent
+    for _ in range(3): # the guess is off by a few bits at most, each pass makes it exact
+        mantissa = int(context.multiply(value, context.power(_TWO, 53 - exponent)).to_integral_value(decimal.ROUND_HALF_EVEN))
+        extra = abs(mantissa).bit_length() - 53
+        if extra == 0:
+            break
+        exponent += extra
+    return _normalized(float(mantissa), exponent - 53)
+
+def _from_int(value):
+    try:
+        return _normalized(float(value), 0)
+    except OverflowError:
+        # keep the top 53 bits, the rest is below the precision of the mantissa anyway
+        shift = abs(value).bit_length() - 53
+        return _normalized(float(value >> shift if value > 0 else -((-value) >> shift)), shift)
+
+# converts int, float and BigNum operands, anything else is left to Python
+def _coerce(value):
+    if value.__class__ is BigNum:
+        return value
+    if value.__class__ is float:
+        return _normalized(value, 0)
+    if isinstance(value, int):
+        return _from_int(value)
+    if isinstance(value, float):
+        return _normalized(float(value), 0)
+    return None
+
+# Class for a float mantissa with an unbounded integer exponent, value = m x 2 ^ e with 0.5 <= |m| < 1 (or m = 0)
+# The exponent is binary, so while a value fits in a float every operation rounds exactly like float arithmetic would.
+# The game keeps balances, prices and rates as plain floats and only switches to BigNum past FLOAT_LIMIT (see fit),
+# BigNum arithmetic is several times slower than float so it is not used where floats are enough.
+class BigNum:
+    __slots__ = ("m", "e")
+
+    def __init__(self, value=0.0, exponent=0):
+        """BigNum(x) converts an int, float, numeric string or BigNum, BigNum(m, e) is m x 2 ^ e."""
+        if isinstance(value, str):
+            number = BigNum.parse(value)
+        else:
+            number = _coerce(value)
+            if number is None:
+                raise TypeError(f"cannot convert {type(value).__name__} to BigNum")
+        if not math.isfinite(number.m):
+            raise ValueError(f"BigNum cannot hold {value!r}, only finite numbers")
+        self.m = number.m
+        self.e = number.e + exponent if number.m else 0
+
+    @classmethod
+    def from_pair(cls, pair):
+        """Inverse of to_pair, used when reading saves."""
+        mantissa = float(pair[0])
+        if not math.isfinite(mantissa):
+            raise ValueError(f"BigNum cannot hold a mantissa of {mantissa!r}")
+        return _normalized(mantissa, int(pair[1]))
+
+    def to_pair(self):
+        """Returns (mantissa, binary exponent) for serialization."""
+        return (self.m, self.e)
+
+    @classmethod
+    def from_log10(cls, log_value):
+        """Returns 10 ^ log_value, for values whose logarithm is known but which may not fit in a float.
+        Only as exact as the float logarithm, parse does not go through it."""
+        log2_value = log_value / _LOG10_2
+        whole = math.floor(log2_value)
+        return _normalized(2.0 ** (log2_value - whole), whole)
+
+    @classmethod
+    def parse(cls, text):
+        """Reads the output of str() or repr() back, e.g. "1234.5", "1.5e+400" or "BigNum(0.5, 1400)".
+        repr() gives back the same BigNum exactly, decimal text is rounded to the nearest one."""
+        text = text.strip()
+        match = _REPR.fullmatch(text)
+        if match:
+            return cls.from_pair((float(match.group(1)), int(match.group(2))))
+        try:
+            value = decimal.Decimal(text)
+        except decimal.InvalidOperation:
+            raise ValueError(f"could not convert string to BigNum: {text!r}")
+        if not value.is_finite():
+            raise ValueError(f"BigNum cannot hold {text!r}, only finite numbers")
+        number = float(text) # correctly rounded while it is a normal float
+        if value.is_zero() or sys.float_info.min <= abs(number) < FLOAT_LIMIT:
+            return _normalized(number, 0)
+        return _from_decimal(value)
+
+    # conversions
+
+    def __float__(self):
+        try:
+            return _ldexp(self.m, self.e)
+        except OverflowError:
+            return math.copysign(math.inf, self.m)
+
+    def __int__(self):
+        if self.e <= 53:
+            return int(_ldexp(self.m, self.e))
+        return int(_ldexp(self.m, 53)) << (self.e - 53)
+
+    def __bool__(self):
+        return self.m != 0.0
+
+    def __floor__(self):
+        if self.e >= 53:
+            return self # already a whole number
+        return _normalized(float(math.floor(_ldexp(self.m, self.e))), 0)
+
+    def __ceil__(self):
+        if self.e >= 53:
+            return self
+        return _normalized(float(math.ceil(_ldexp(self.m, self.e))), 0)
+
+    def __round__(self, digits=None):
+        if self.e >= 53:
+            return self
+        return _normalized(float(round(_ldexp(self.m, self.e), digits)), 0)
+
+    def is_finite_float(self):
+        """True if the value fits in a float."""
+        return self.e <= 1024
+
+    # arithmetic
+
+    def __add__(self, other):
+        if other.__class__ is not BigNum:
+            other = _coerce(other)
+            if other is None:
+                return NotImplemented
+        if other.m == 0.0:
+            return self
+        if self.m == 0.0:
+            return other
+        shift = self.e - other.e
+        if shift >= 0:
+            if shift > _ADD_CUTOFF:
+                return self
+            fm, fe = _frexp(self.m + _ldexp(other.m, -shift))
+            e = self.e
+        else:
+            if shift < -_ADD_CUTOFF:
+                return other
+            fm, fe = _frexp(other.m + _ldexp(self.m, shift))
+            e = other.e
+        if fm == 0.0:
+            return ZERO
+        return _make(fm, e + fe)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _make(-self.m, self.e)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.m >= 0 else _make(-self.m, self.e)
+
+    def __sub__(self, other):
+        if other.__class__ is not BigNum:
+            other = _coerce(other)
+            if other is None:
+                return NotImplemented
+        return self.__add__(_make(-other.m, other.e))
+
+    def __rsub__(self, other):
+        other = _coerce(other)
+        if other is None:
+            return NotImplemented
+        return other.__add__(_make(-self.m, self.e))
+
+    def __mul__(self, other):
+        if other.__class__ is not BigNum:
+            other = _coerce(other)
+            if other is None:
+                return NotImplemented
+        fm, fe = _frexp(self.m * other.m)
+        if fm == 0.0:
+            return ZERO
+        return _make(fm, self.e + other.e + fe)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if other.__class__ is not BigNum:
+            other = _coerce(other)
+            if other is None:
+                return NotImplemented
+        fm, fe = _frexp(self.m / other.m)
+        if fm == 0.0:
+            return ZERO
+        return _make(fm, self.e - other.e + fe)
+
+    def __rtruediv__(self, other):
+        other = _coerce(other)
+        if other is None:
+            return NotImplemented
+        return other.__truediv__(self)
+
+    def __floordiv__(self, other):
+        return math.floor(self / other)
+
+    def __pow__(self, power):
+        if isinstance(power, BigNum):
+            power = float(power)
+        # inside the float range use float pow so results match plain floats exactly
+        if self.e <= 1024:
+            try:
+                result = _ldexp(self.m, self.e) ** power
+                if math.isfinite(result) and (result != 0.0 or self.m == 0.0):
+                    return _normalized(result, 0)
+            except (OverflowError, ZeroDivisionError):
+                pass
+        if self.m <= 0:
+            raise ValueError("BigNum powers past the float range need a positive base")
+        log2_value = (math.log2(self.m) + self.e) * power
+        whole = math.floor(log2_value)
+        return _normalized(2.0 ** (log2_value - whole), whole)
+
+    def __rpow__(self, base):
+        return BigNum(base) ** float(self)
+
+    # comparison, normalized values order by sign, then exponent, then mantissa
+
+    def _compare(self, other):
+        if other.__class__ is not BigNum:
+            other = _coerce(other)
+            if other is None:
+                return None
+        a, b = self.m, other.m
+        if self.e == other.e or a == 0.0 or b == 0.0 or (a > 0) != (b > 0):
+            return (a > b) - (a < b)
+        # same sign and different exponents, the larger exponent has the larger magnitude
+        if a > 0:
+            return 1 if self.e > other.e else -1
+        return -1 if self.e > other.e else 1
+
+    def __eq__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result == 0
+
+    def __ne__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result != 0
+
+    def __lt__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result < 0
+
+    def __le__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result <= 0
+
+    def __gt__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result > 0
+
+    def __ge__(self, other):
+        result = self._compare(other)
+        return NotImplemented if result is None else result >= 0
+
+    def __hash__(self):
+        if self.e <= 1024:
+            return hash(_ldexp(self.m, self.e)) # equal floats and BigNums hash the same
+        return hash((self.m, self.e))
+
+    # logarithms
+
+    def log2(self):
+        return math.log2(self.m) + self.e
+
+    def log10(self):
+        return math.log10(self.m) + self.e * _LOG10_2
+
+    def log(self):
+        return math.log(self.m) + self.e * _LN_2
+
+    # formatting
+
+    def __format__(self, spec):
+        if self.e <= 1024:
+            return format(_ldexp(self.m, self.e), spec)
+        # past the float range, show a decimal mantissa and exponent with the requested precision
+        match = _PRECISION.search(spec)
+        digits = int(match.group(1)) if match else 3
+        sign = "-" if self.m < 0 else ""
+        log_value = abs(self).log10()
+        exponent = math.floor(log_value)
+        mantissa = round(10 ** (log_value - exponent), digits)
+        if mantissa >= 10:
+            mantissa /= 10
+            exponent += 1
+        return f"{sign}{mantissa:.{digits}f}e+{exponent}"
+
+    def __str__(self):
+        if -1021 <= self.e <= 1024 or not self.m: # a normal float holds the value exactly
+            return str(_ldexp(self.m, self.e))
+        # the exact value m x 2 ^ e with the fewest significant digits (17 at most) that parse reads back to the same BigNum
+        context = _decimal_context()
+        exact = context.multiply(decimal.Decimal(int(_ldexp(self.m, 53))), context.power(_TWO, self.e - 53))
+        for digits in range(15, _DIGITS + 1):
+            rounded = decimal.Context(prec=digits, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN).plus(exact)
+            if digits == _DIGITS or _from_decimal(rounded) == self:
+                return format(rounded.normalize(context), "e")
+
+    def __repr__(self):
+        # the exact mantissa and binary exponent, BigNum(m, e) and parse both read it back unchanged
+        return f"BigNum({self.m!r}, {self.e})"
+
+    def __reduce__(self):
+        return (BigNum.from_pair, ((self.m, self.e),))
+
+ZERO = _make(0.0, 0)
+
+# helpers that accept both BigNum and plain numbers
+
+def fit(value):
+    """Returns value as a plain float while its magnitude is below FLOAT_LIMIT and as a BigNum above it."""
+    if value.__class__ is float:
+        if -FLOAT_LIMIT < value < FLOAT_LIMIT:
+            return value
+        if math.isinf(value) or math.isnan(value):
+            raise OverflowError("float overflowed before it was promoted to a BigNum")
+        return _normalized(value, 0)
+    if value.__class__ is BigNum:
+        return _ldexp(value.m, value.e) if value.e < _BIG_EXPONENT else value
+    if isinstance(value, int):
+        return float(value) if -FLOAT_LIMIT < value < FLOAT_LIMIT else _from_int(value)
+    return fit(float(value))
+
+def log10(value):
+    """math.log10 that also works past the float range."""
+    return value.log10() if value.__class__ is BigNum else math.log10(value)
+
+def log(value):
+    """math.log that also works past the float range."""
+    return value.log() if value.__class__ is BigNum else math.log(value)
+
+def isfinite(value):
+    """math.isfinite, a BigNum is always finite."""
+    return value.__class__ is BigNum or math.isfinite(value)
@@ -10,27 +10,29 @@ Last Modified: 12/5/2024
 '''
 
 import pygame
+from assets import load_image
+from fonts import get_font, render_text
 
 # Base class for buttons
 class Button:
     def __init__(self, x, y, width, height, text, font_size, image_file):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.SysFont(None, font_size)
+        self.font = get_font(font_size)
         self.image_file = image_file
         self.x = x
         self.y = y
         self.clicked = False  # Flag to check if the button was clicked
 
     def draw_text(self, text, font, color, x, y, screen):
-        text_obj = font.render(text, True, color)
+        text_obj = render_text(text, font, color)
         screen.blit(text_obj, (x, y))
 
     def draw(self, screen, custom_font):
         if custom_font != False: #check if custom font was passed in, if so switch to that font
             self.font = custom_font
         if self.image_file is not None:
-            IMAGE = pygame.transform.scale(pygame.image.load(self.image_file).convert_alpha(), (self.rect.width, self.rect.height))
+            IMAGE = load_image(self.image_file, (self.rect.width, self.rect.height))
             screen.blit(IMAGE, self.rect)
             self.draw_text(self.text, self.font, (255,255,255), self.rect.x + 10, self.rect.y + 5, screen)
         else:
@@ -10,34 +10,44 @@ Last Modified: 11/24/2024
 '''
 
 from game import *
+from assets import load_image, RotationAtlas
 
 BLACK = (0, 0, 0)
 shimmer_png_path = "./assets/cookie_shimmer/cookie_shine"
+ROTATION_STEPS = 360 # number of angles for the spinning cookie, one per degree it turns each frame (fewer if they do not fit the cap)
+ROTATION_MEMORY_CAP = 256 * 1024 * 1024 # max bytes of rotation frames, a full turn at one degree fits up to a 1920 pixel wide window
 
 # Class for managing the cookie
 class Cookie:
     # initializes the image and dimensions for the clickable cookie
     def __init__(self, image_path, size_percent, WIDTH, HEIGHT):
-        self.image = pygame.image.load(image_path)
-        self.size = int(WIDTH * size_percent)
-        self.image = pygame.transform.scale(self.image, (self.size, self.size))
-        self.rect = self.image.get_rect(center=(WIDTH * 0.165, HEIGHT // 2))  # Centered in the left partition
+        self.image_path = image_path
+        self.size_percent = size_percent
         self.angle = 0  # Initialize rotation angle
-        #load all sprites for shine animation
-        self.shine_sprites = [pygame.image.load(f'{shimmer_png_path}1.png'),pygame.image.load(f'{shimmer_png_path}2.png'),pygame.image.load(f'{shimmer_png_path}3.png'),
-                      pygame.image.load(f'{shimmer_png_path}4.png'),pygame.image.load(f'{shimmer_png_path}5.png'),pygame.image.load(f'{shimmer_png_path}6.png'),
-                      pygame.image.load(f'{shimmer_png_path}7.png'),pygame.image.load(f'{shimmer_png_path}8.png'),pygame.image.load(f'{shimmer_png_path}9.png'),
-                      pygame.image.load(f'{shimmer_png_path}10.png')]
+        #paths of all sprites for shine animation, surfaces come from the shared asset cache
+        self.shine_sprites = [f'{shimmer_png_path}{i}.png' for i in range(1, 11)]
         self.current_shine = 0 #stating point of animation
-        self.image2 = pygame.transform.scale(self.shine_sprites[self.current_shine], (self.size, self.size)) #scale sprite to correct size
         self.is_animating = False #false until we want it to animate
+        self.resize(WIDTH, HEIGHT)
+
+    # scales the cookie to a new window size, the rotation and shimmer carry on where they were
+    def resize(self, WIDTH, HEIGHT):
+        self.size = int(WIDTH * self.size_percent)
+        self.image = load_image(self.image_path, (self.size, self.size))
+        self.rect = self.image.get_rect(center=(WIDTH * 0.165, HEIGHT // 2))  # Centered in the left partition
+        self.rotation_atlas = RotationAtlas(self.image, ROTATION_STEPS, ROTATION_MEMORY_CAP) # rotated frames are rendered once and reused
+        self.image2 = self.shine_frame(self.current_shine)
+
+    # shimmer frames are cut from the sprite atlas and scaled the first time they are shown
+    def shine_frame(self, index):
+        return load_image(self.shine_sprites[index], (self.size, self.size))
 
 
-    # renders a cookie onto the screen that rotates
+    # renders a cookie onto the screen that rotates, returns the area drawn
     def draw(self, screen):
-        rotated_image = pygame.transform.rotate(self.image, self.angle)
+        rotated_image = self.rotation_atlas.get(self.angle)
         new_rect = rotated_image.get_rect(center=self.rect.center)  # Center at original position
-        screen.blit(rotated_image, new_rect.topleft)
+        return screen.blit(rotated_image, new_rect.topleft)
         # pygame.draw.rect(screen, BLACK, self.rect, 2)  # Draw rectangle around the cookie
 
     # updates the angle of rotation for the cookie
@@ -53,7 +63,7 @@ class Cookie:
             if self.current_shine >= len(self.shine_sprites): #check if we've gone past all sprites then reset
                 self.current_shine = 0
                 self.is_animating = False
-            self.image2 = pygame.transform.scale(self.shine_sprites[int(self.current_shine)], (self.size, self.size)) #scale sprite
+            self.image2 = self.shine_frame(int(self.current_shine)) #scaled once, then served from the asset cache
 
     def animate(self): #begin animating sprite
         self.is_animating = True
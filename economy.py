@@ -0,0 +1,107 @@
+'''
+Module Name: economy.py
+Purpose: The cookie economy (balance, purchases, cookies per second and per click) without any pygame rendering
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+from bignum import BigNum, fit
+from pricing import item_price
+from rates import RateCache
+
+# Class holding the player's balance, purchases and production rates
+# UIManager builds on it for the game, the Simulator uses it on its own for headless runs
+class Economy:
+    def __init__(self, shop_items, shop_upgrades, prestige=None):
+        self.cookie_count = 0 # a plain number, or a BigNum once it passes bignum.FLOAT_LIMIT
+        self.upgrades_acquired = []
+        self.shop_items = shop_items # name -> ShopItem
+        self.shop_upgrades = shop_upgrades # name -> ShopUpgrade
+        self.prestige = prestige # optional, its upgrades add to cookies per second
+        self.base_cookie_per_click = 1 # Start with 1 base cookie per click
+        self.click_multiplier = 1.0     # Multiplier starts at 1.0 (no effect initially)
+        self.modifiers = {} # modifier id -> (target "cpc" or "cps", multiplier), one per active event
+        self.cps_multiplier = 1.0 # product of the active "cps" modifiers, rebuilt from the stack whenever it changes
+        # CPS and CPC are cached and only updated when a purchase, prestige or event changes them
+        self.cps_cache = RateCache(self.compute_cookies_per_second, "cookies per second")
+        self.cpc_cache = RateCache(self.compute_cookie_per_click, "cookies per click")
+
+    # buys quantity of an item in a single transaction and applies its effects
+    def apply_purchase(self, item, quantity):
+        # Deduct the cookie count and update purchase state
+        price = item_price(item, quantity)
+        self.cookie_count = fit(self.cookie_count - price)
+        item.purchased_count += quantity  # Increment the purchase count
+
+        # Add the item to upgrades_acquired if not already in the list
+        if item not in self.upgrades_acquired:
+            self.upgrades_acquired.append(item)
+
+        # Apply the item's effects, compiled from the shop catalog (see shop.py)
+        for effect in item.effects:
+            effect.apply(self, quantity)
+
+        # Recalculate cookies per click
+        self.cpc_cache.invalidate()
+        return price
+
+    # returns the amount of cookies the user should be earning per second, from the cached aggregate and the active modifiers
+    def cookies_per_second(self):
+        if self.cps_multiplier == 1.0:
+            return self.cps_cache.value
+        return fit(BigNum(self.cps_cache.value) * self.cps_multiplier)
+
+    # returns the amount of cookies earned per click, from the cached aggregate
+    @property
+    def cookie_per_click(self):
+        return self.cpc_cache.value
+
+    # recomputes cookies per second from every shop item and prestige upgrade, only needed when the cache is dirty
+    def compute_cookies_per_second(self):
+        total = sum(item.cps * item.purchased_count for item in self.shop_items.values() if item.cps != None)
+        if self.prestige is not None:
+            total += sum(item.cps * item.purchased_count for (key,item) in self.prestige.get_shop_items() if item.cps != None)
+        return fit(total)
+
+    # recomputes cookies per click from the base, the click multipliers and any active events
+    def compute_cookie_per_click(self):
+        cookie_per_click = BigNum(self.base_cookie_per_click) * self.click_multiplier # both can be past the float range
+        for target, multiplier in self.modifiers.values():
+            if target == "cpc":
+                cookie_per_click *= multiplier
+        return fit(cookie_per_click)
+
+    # marks both aggregates dirty, used after the purchased counts are replaced (load, new game, prestige)
+    def refresh_rates(self):
+        self.cps_cache.invalidate()
+        self.cpc_cache.invalidate()
+
+    # pushes a multiplier on cookies per click ("cpc") or per second ("cps"), e.g. while an event is active
+    def add_modifier(self, modifier, target, multiplier):
+        self.modifiers[modifier] = (target, multiplier)
+        self._modifiers_changed(target)
+
+    # removes a modifier, the rates are recomputed from what is left so nothing drifts
+    def remove_modifier(self, modifier):
+        removed = self.modifiers.pop(modifier, None)
+        if removed is not None:
+            self._modifiers_changed(removed[0])
+
+    # drops every modifier, used when a save replaces the state the running events were applied to
+    def clear_modifiers(self):
+        self.modifiers.clear()
+        self.cps_multiplier = 1.0
+        self.cpc_cache.invalidate()
+
+    def _modifiers_changed(self, target):
+        if target == "cps":
+            self.cps_multiplier = 1.0
+            for modifier_target, multiplier in self.modifiers.values():
+                if modifier_target == "cps":
+                    self.cps_multiplier *= multiplier
+        else:
+            self.cpc_cache.invalidate()
@@ -0,0 +1,153 @@
+'''
+Module Name: events.py
+Purpose: Random events (Golden Cookie, Cookie Storm, Gambling) run off the timer scheduler, with their weights and effects read from data/events.json
+Inputs: data/events.json
+Output: None
+Additional code sources: https://docs.python.org/3/library/random.html#random.Random.choices
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import functools
+import itertools
+import json
+import os
+import random
+import time
+
+from autosave import autosave
+from bignum import fit
+
+EVENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "events.json")
+POPUP_SECONDS = 3 # how long the event banner stays up
+
+# Class for one event type from the data file
+class EventDefinition:
+    def __init__(self, name, weight=1, kind="modifier", target="cpc", multiplier=1, duration=0, message="",
+                 win_chance=0.5, payout=2):
+        if kind not in ("modifier", "gambling"):
+            raise ValueError(f"event {name!r} has unknown kind {kind!r}")
+        if target not in ("cpc", "cps"):
+            raise ValueError(f"event {name!r} has unknown target {target!r}")
+        if weight < 0 or duration < 0:
+            raise ValueError(f"event {name!r} needs a non-negative weight and duration")
+        self.name = name
+        self.weight = weight # relative chance of being picked each interval
+        self.kind = kind # "modifier" multiplies CPC or CPS for a while, "gambling" asks the player to risk their cookies
+        self.target = target # "cpc" or "cps", for modifiers
+        self.multiplier = multiplier
+        self.duration = duration # seconds
+        self.message = message # banner shown when the event starts
+        self.win_chance = win_chance # gambling only
+        self.payout = payout # gambling only, the balance is multiplied by this on a win
+
+# reads the event table, returns (seconds between events, list of EventDefinition)
+def load_events(path=EVENTS_FILE):
+    with open(path, 'r') as file:
+        data = json.load(file)
+    events = [EventDefinition(**event) for event in data["events"]]
+    if not events or not any(event.weight for event in events):
+        raise ValueError(f"{path} needs at least one event with a positive weight")
+    return data["interval"], events
+
+# Class that starts a random event every interval and ends each one when its timer runs out
+# every activation adds its own modifier to the economy, so overlapping events stack and a purchase
+# in the middle of one does not change what is undone when it ends
+class RandomEventManager:
+    def __init__(self, scheduler, get_state, path=EVENTS_FILE, seed=None, verbose=True):
+        self.scheduler = scheduler
+        self.verbose = verbose # prints each event to the console, the headless simulator turns it off
+        self.get_state = get_state # returns the current UIManager, it is replaced when a save is loaded
+        self.interval, self.events = load_events(path)
+        self.weights = [event.weight for event in self.events]
+        self.rng = random.Random(seed) # pass a seed for reproducible runs
+        self.active_events = {} # modifier id -> (event name, end time)
+        self.activations = itertools.count(1)
+        self.started = 0 # events started, gambles included
+        self.show_gambling_popup = False
+        self.gambling_event = None # EventDefinition of the open gambling popup
+        self.next_timer = None
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def start(self, now=None):
+        """Schedules the first event one interval from now."""
+        if self.next_timer is not None:
+            self.next_timer.cancel()
+        self.next_timer = self.scheduler.call_later(self.interval, self.on_interval, now=now)
+
+    # runs once per interval, schedules the next interval from when this one was due before starting an event
+    # so the intervals do not drift by a frame each time and a run_due ahead of the clock still ends
+    def on_interval(self, due):
+        self.next_timer = self.scheduler.call_at(due + self.interval, self.on_interval)
+        self.trigger_event(self.get_state(), now=due)
+
+    def trigger_event(self, ui_manager, event=None, now=None):
+        """Starts event, or one picked at random by weight, at time now (the scheduler's clock if None)."""
+        if event is None:
+            event = self.rng.choices(self.events, weights=self.weights)[0]
+        self.started += 1
+        if event.kind == "gambling":
+            if self.show_gambling_popup:
+                return # one gamble at a time
+            self.log("Gambling Event! Risk it all!")
+            self.gambling_event = event
+            self.show_gambling_popup = True  # Show gambling popup
+            return
+
+        self.log(f"{event.name} started! x{event.multiplier} {event.target.upper()} for {event.duration} seconds")
+        modifier = f"{event.name} #{next(self.activations)}"
+        ui_manager.add_modifier(modifier, event.target, event.multiplier)
+        end = (self.scheduler.clock() if now is None else now) + event.duration
+        self.active_events[modifier] = (event.name, end)
+        self.scheduler.call_at(end, self.clear_event, modifier)
+
+        # Set the event popup
+        ui_manager.active_event_popup = event.message
+        ui_manager.event_popup_end_time = time.time() + POPUP_SECONDS
+
+    def is_event_active(self, name):
+        """Check if a specific event is active."""
+        return any(active_name == name for active_name, _ in self.active_events.values())
+
+    def clear_active(self):
+        """Forgets the running events after a save replaced the economy they modified, their end timers then do nothing."""
+        self.active_events.clear()
+
+    # runs when an activation's timer is due, removes only that activation's modifier
+    def clear_event(self, due, modifier):
+        name, _ = self.active_events.pop(modifier, (None, None))
+        if name is None:
+            return
+        self.log(f"Ending event '{name}' at time {due}")
+        self.get_state().remove_modifier(modifier)
+
+    def resolve_gambling_event(self, ui_manager, risk):
+        event = self.gambling_event
+        if risk and event is not None:
+            if self.rng.random() <= event.win_chance:
+                ui_manager.cookie_count = fit(ui_manager.cookie_count * event.payout)
+                self.log(f"Lucky! Your cookies were multiplied by {event.payout}!")
+            else:
+                ui_manager.cookie_count = 0
+                self.log("Unlucky! You lost your cookies!")
+        else:
+            self.log("You chose not to gamble!")
+        autosave.notify("gambling")
+
+        # Close the popup
+        self.show_gambling_popup = False
+        self.gambling_event = None
+
+# expected multiplier on CPC or CPS averaged over time, used for offline earnings
+# exact while events of one kind do not overlap, which holds as long as their durations are shorter than the interval
+@functools.lru_cache(maxsize=None)
+def expected_multiplier(target, path=EVENTS_FILE):
+    interval, events = load_events(path)
+    total_weight = sum(event.weight for event in events)
+    extra = sum(event.weight * (event.multiplier - 1) * event.duration for event in events
+                if event.kind == "modifier" and event.target == target)
+    return 1 + extra / (total_weight * interval)
@@ -0,0 +1,69 @@
+'''
+Module Name: fonts.py
+Purpose: Memoizes system fonts by size and caches rendered text surfaces so unchanged labels only cost a blit
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+from collections import OrderedDict
+import pygame
+
+# Class that creates each SysFont size once and hands back the same object afterwards
+class FontRegistry:
+    def __init__(self, name=None):
+        self.name = name # system font name, None uses pygame's default font
+        self.fonts = {} # size -> pygame.font.Font
+
+    def get(self, size):
+        size = int(size)
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(self.name, size)
+            self.fonts[size] = font
+        return font
+
+# Class for an LRU cache of rendered text surfaces keyed by (text, font, color)
+class TextCache:
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries # oldest surfaces are dropped once the cache is full
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, antialias=True):
+        """Returns the rendered surface for text, rendering it only if it is not cached."""
+        key = (text, font, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        """Returns the hit/miss counters and the number of cached surfaces."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.surfaces)}
+
+# process-wide registry and text cache shared by the UI, buttons and prestige menus
+font_registry = FontRegistry()
+text_cache = TextCache()
+
+# gets the font for rendering text
+def get_font(size):
+    return font_registry.get(size)
+
+# renders text through the shared cache
+def render_text(text, font, color):
+    return text_cache.render(text, font, color)
@@ -0,0 +1,219 @@
+'''
+Module Name: input_dispatch.py
+Purpose: Routes mouse clicks to the topmost active layer (main menu, popups, prestige menu, game) and hit-tests buttons with a spatial index
+Inputs: Mouse clicks from Game.handle_events
+Output: None
+Additional code sources: https://docs.python.org/3/library/bisect.html, https://en.wikipedia.org/wiki/Interval_tree
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import bisect
+
+import pygame
+
+# Class for finding the rect under a point without testing every rect
+# the rects' top and bottom edges cut the plane into horizontal slabs, each slab keeps the rects crossing it sorted by
+# their left edge, so a lookup is one bisect for the slab and one for the rect, O(log n) when rects in a row do not overlap
+class SpatialIndex:
+    def __init__(self, entries=()):
+        # entries are (rect, target), a later entry is on top of an earlier one it overlaps
+        rects = [(pygame.Rect(rect), order, target) for order, (rect, target) in enumerate(entries)]
+        rects = [entry for entry in rects if entry[0].width > 0 and entry[0].height > 0]
+        self.edges = sorted({rect.top for rect, _, _ in rects} | {rect.bottom for rect, _, _ in rects})
+        self.slabs = [] # per slab: (left edges, entries sorted by left edge, furthest right edge up to each entry)
+        # sweep down the slabs keeping the rects that cross the current one
+        by_top = sorted(rects, key=lambda entry: entry[0].top)
+        next_rect = 0
+        crossing = []
+        for top in self.edges[:-1]:
+            crossing = [entry for entry in crossing if entry[0].bottom > top]
+            while next_rect < len(by_top) and by_top[next_rect][0].top <= top:
+                crossing.append(by_top[next_rect])
+                next_rect += 1
+            crossing.sort(key=lambda entry: entry[0].left)
+            reach = []
+            for rect, _, _ in crossing:
+                reach.append(max(rect.right, reach[-1]) if reach else rect.right)
+            self.slabs.append(([rect.left for rect, _, _ in crossing], crossing, reach))
+        self.size = len(rects)
+
+    def hit(self, pos):
+        """Returns the target of the topmost rect containing pos, None if there is none."""
+        x, y = pos
+        slab = bisect.bisect_right(self.edges, y) - 1
+        if slab < 0 or slab >= len(self.slabs):
+            return None
+        lefts, crossing, reach = self.slabs[slab]
+        index = bisect.bisect_right(lefts, x) - 1
+        best = None
+        # walk left only while some rect further left still reaches past x
+        while index >= 0 and reach[index] > x:
+            rect, order, target = crossing[index]
+            if rect.right > x and (best is None or order > best[0]):
+                best = (order, target)
+            index -= 1
+        return None if best is None else best[1]
+
+    def __len__(self):
+        return self.size
+
+# Class for one layer of the screen, the dispatcher hands a click to the topmost active layer
+# a modal layer keeps every click while it is active, even ones that miss its buttons
+class Layer:
+    modal = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def active(self):
+        return False
+
+    def handle_click(self, mouse_pos, button):
+        """Handles a click, returns True if it landed on something."""
+        return False
+
+# Class for the main menu and the save, new game and settings popups opened from it
+class MenuLayer(Layer):
+    def __init__(self, game):
+        super().__init__(game)
+        self.indexed = None # main_menu_buttons list the index was built from
+        self.index = SpatialIndex()
+
+    def active(self):
+        return self.game.ui_manager.show_main_menu
+
+    def handle_click(self, mouse_pos, button):
+        game = self.game
+        ui_manager = game.ui_manager
+        left_click = button == 1 # popup buttons only respond to the left mouse button
+        if ui_manager.show_saves_menu:
+            ui_manager.slot_pick = None
+            handled = left_click and ui_manager.saves_popup.handle_click(mouse_pos)
+            if ui_manager.slot_pick is not None:
+                game.load_slot(ui_manager.slot_pick)
+            return handled
+        if ui_manager.show_new_game_menu:
+            ui_manager.slot_pick = None
+            handled = left_click and ui_manager.new_game_popup.handle_click(mouse_pos)
+            if ui_manager.slot_pick is not None:
+                game.start_slot(ui_manager.slot_pick)
+            return handled
+        if ui_manager.show_settings_popup:
+            ui_manager.settings_pick = None
+            handled = left_click and ui_manager.settings_popup.handle_click(mouse_pos)
+            if ui_manager.settings_pick is not None:
+                game.handle_settings_pick(ui_manager.settings_pick)
+            return handled
+
+        if self.indexed is not ui_manager.main_menu_buttons: # the buttons are rebuilt when the window is resized
+            self.indexed = ui_manager.main_menu_buttons
+            self.index = SpatialIndex((menu_button.rect, menu_button.text) for menu_button in self.indexed)
+        label = self.index.hit(mouse_pos)
+        if label is None:
+            return False
+        ui_manager.sound_manager.play_sound("menu-click")
+        if label == "Continue":
+            ui_manager.handle_save_slot_click()
+        elif label == "New Game":
+            ui_manager.handle_new_game_click()
+        elif label == "Settings":
+            ui_manager.handle_setting_popup_click()
+        elif label == "Exit":
+            game.quit()
+        return True
+
+# Class for the popups drawn over the game: the gambling event, the options menu and the welcome back popup
+class PopupLayer(Layer):
+    def active(self):
+        ui_manager = self.game.ui_manager
+        return self.game.random_event_manager.show_gambling_popup or ui_manager.show_popup or ui_manager.show_popup_cookie_earned
+
+    def handle_click(self, mouse_pos, button):
+        if button != 1:
+            return False
+        ui_manager = self.game.ui_manager
+        # the popup drawn last is on top and gets the click
+        if self.game.random_event_manager.show_gambling_popup:
+            return ui_manager.handle_gambling_click(mouse_pos, self.game.random_event_manager)
+        if ui_manager.show_popup:
+            return ui_manager.options_popup.handle_click(mouse_pos)
+        return ui_manager.cookie_earned_popup.handle_click(mouse_pos)
+
+# Class for the prestige menu and its confirmation popup
+class PrestigeLayer(Layer):
+    def active(self):
+        prestige = self.game.prestige
+        return prestige.show_prestige_menu or prestige.show_prestige_verify
+
+    def handle_click(self, mouse_pos, button):
+        return button == 1 and self.game.prestige.handle_click(self.game.ui_manager, mouse_pos)
+
+# Class for the game screen: the cookie, the toolbar buttons and the shop
+class GameLayer(Layer):
+    modal = False
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.indexed = None # objects the index was built from, it is rebuilt when any of them is replaced
+        self.index = SpatialIndex()
+        self.builds = 0 # times the index was built, once per layout
+
+    def active(self):
+        return True
+
+    # rebuilds the index when the layout changes: the shop slots, the toolbar or the cookie are replaced on a resize
+    # the shop is indexed by slot, one per catalog item, so buying or clicking (which changes the buttons shown) costs no rebuild
+    def _refresh(self):
+        ui_manager = self.game.ui_manager
+        sources = (ui_manager.shop_slots, ui_manager.buy_mode_button, ui_manager.popup_button, ui_manager.prestige_button, self.game.cookie.rect)
+        if self.indexed is not None and all(new is old for new, old in zip(sources, self.indexed)):
+            return
+        entries = list(ui_manager.shop_slots)
+        entries.append((self.game.cookie.rect, "cookie"))
+        entries.append((ui_manager.buy_mode_button.rect, "buy mode"))
+        entries.append((ui_manager.popup_button.rect, "options"))
+        entries.append((ui_manager.prestige_button.rect, "prestige"))
+        self.index = SpatialIndex(entries)
+        self.indexed = sources
+        self.builds += 1
+
+    def handle_click(self, mouse_pos, button):
+        self._refresh()
+        target = self.index.hit(mouse_pos)
+        if target is None:
+            return False
+        game = self.game
+        if target == "cookie":
+            game.click_cookie(mouse_pos)
+        elif target == "buy mode":
+            game.ui_manager.sound_manager.play_sound("menu-click")
+            game.ui_manager.cycle_buy_mode()
+        elif target == "options":
+            game.ui_manager.handle_popup_click()
+        elif target == "prestige":
+            game.prestige.handle_prestige_click()
+        elif game.ui_manager.purchase_quantity(target) == 0:
+            return False # the item's button is hidden while it is unaffordable, so the click landed on nothing
+        else:
+            game.ui_manager.click_shop_item(target)
+        return True
+
+# Class that hands each click to the topmost active layer, a modal layer stops it from reaching the layers below
+class InputDispatcher:
+    def __init__(self, layers):
+        self.layers = layers # topmost first
+
+    def dispatch_click(self, mouse_pos, button):
+        """Routes a click, returns the layer that took it or None."""
+        for layer in self.layers:
+            if not layer.active():
+                continue
+            if layer.handle_click(mouse_pos, button) or layer.modal:
+                return layer
+        return None
+
+# the layers of the game screen, topmost first
+def create_dispatcher(game):
+    return InputDispatcher([MenuLayer(game), PopupLayer(game), PrestigeLayer(game), GameLayer(game)])
@@ -9,56 +9,99 @@ Date: 10/26/2024
 Last Modified: 10/26/2024
 '''
 
+import os
 import time
 
-# function to load the user's save file (currently hardcoded to save.txt)
-def load(ui_manager, save_name):
-    try:
-        with open(save_name, 'r') as file:
-            for number, line in enumerate(file):
-                if number == 0:
-                    time_diff = time.time() - float(line.strip())
-                    ui_manager.last_played_timestamp = line.strip()
-                elif number == 1:
-                    ui_manager.cookie_count = float(line.strip())
-                elif number == 2:
-                    ui_manager.base_cookie_per_click = float(line.strip())
-                elif number == 3:
-                    ui_manager.click_multiplier = float(line.strip())
-                else:
-                    item = line.split(':')
-                    item_name = item[0].strip('"')
-                    purchased_count = int(item[1].strip())
-                    
-                    if item_name in ui_manager.shop_items:
-                        shop_item = ui_manager.shop_items[item_name]
-                        shop_item.purchased_count = purchased_count
-                        if purchased_count > 0:
-                            ui_manager.upgrades_acquired.append(shop_item)
-                    elif item_name in ui_manager.shop_upgrades:
-                        shop_upgrade = ui_manager.shop_upgrades[item_name]
-                        shop_upgrade.purchased_count = purchased_count
-                        if purchased_count > 0:
-                            ui_manager.upgrades_acquired.append(shop_upgrade)
+from bignum import fit
+from offline import offline_progress
+
+from save_format import decode, SaveFormatError
+from save_writer import save_writer, backup_path, read_journal, BACKUPS
+
+# copies a decoded snapshot onto the ui_manager (or a bare Economy), anything the save does not mention goes back to its default
+def apply_snapshot(ui_manager, state):
+    ui_manager.last_played_timestamp = state["timestamp"]
+    # the save stores BigNums, the game keeps plain floats until a value passes the float range
+    ui_manager.cookie_count = fit(state["cookie_count"])
+    ui_manager.base_cookie_per_click = fit(state["base_cookie_per_click"])
+    ui_manager.click_multiplier = fit(state["click_multiplier"])
+    purchases = state["purchases"]
+    ui_manager.upgrades_acquired = []
+    for item in list(ui_manager.shop_items.values()) + list(ui_manager.shop_upgrades.values()):
+        item.purchased_count = purchases.get(item.name, 0)
+        if item.purchased_count > 0:
+            ui_manager.upgrades_acquired.append(item)
+
+    prestige = getattr(ui_manager, "prestige", None)
+    if prestige is not None:
+        prestige.prestige_count = state["prestige_count"]
+        prestige.golden_cookies = fit(state["golden_cookies"])
+        for key, item in prestige.get_shop_items():
+            item.purchased_count = state["prestige_upgrades"].get(key, 0)
+    achievement_manager = getattr(ui_manager, "achievement_manager", None)
+    if achievement_manager is not None:
+        achievement_manager.load_state(state["achievements"])
+    analytics = getattr(ui_manager, "analytics", None)
+    if analytics is not None:
+        analytics.total_cookies = fit(state["total_click_cookies"])
+        analytics.clicks = state["clicks"]
 
-            # Calculate bonus cookies
-            bonus_cookies = time_diff / 60
-            ui_manager.cookie_count += round(bonus_cookies * ui_manager.cookies_per_second())
-            ui_manager.cookie_per_click = ui_manager.base_cookie_per_click * ui_manager.click_multiplier
-            
-            # Trigger popup with bonus cookies
-            ui_manager.show_popup_cookie_earned = True
-            ui_manager.bonus_cookies = bonus_cookies
-            return True
-    except FileNotFoundError:
-        print('Save file not found! Starting a new game.')
-        return None
-    except (ValueError, IndexError) as e:
-        print(f"Error loading save file: {e}")
+    # event modifiers belong to the session that started them, a loaded save (and its offline credit) starts without them
+    ui_manager.clear_modifiers()
+    # the purchased counts were replaced, so the cached CPS/CPC have to be recomputed
+    ui_manager.refresh_rates()
+
+# replays purchases journaled after the snapshot was written, returns the time of the last one
+# records at or before since (the snapshot's timestamp) are already in the snapshot, they are left over when the game
+# died between writing the snapshot and emptying the journal
+def replay_journal(ui_manager, save_name, since=None):
+    last_time = None
+    for timestamp, name, quantity, cookie_count in read_journal(save_name):
+        if since is not None and timestamp <= since:
+            continue
+        item = ui_manager.shop_items.get(name) or ui_manager.shop_upgrades.get(name)
+        if item is None:
+            continue
+        ui_manager.apply_purchase(item, quantity)
+        ui_manager.cookie_count = fit(cookie_count) # the balance also included production and clicks since the last record
+        last_time = timestamp
+    return last_time
+
+# reads the newest snapshot that decodes, falling back to the backups, returns (state, backup number) or (None, None)
+def read_snapshot(save_name):
+    for number in range(BACKUPS + 1):
+        path = save_name if number == 0 else backup_path(save_name, number)
+        try:
+            with open(path, 'rb') as file:
+                return decode(file.read()), number
+        except FileNotFoundError:
+            continue
+        except SaveFormatError as e:
+            print(f"Error loading save file {path}: {e}")
+    return None, None
+
+# function to load the user's save file, binary saves and the old text saves are both accepted
+def load(ui_manager, save_name):
+    save_writer.flush() # a save that is still being written would be read half finished
+    state, number = read_snapshot(save_name)
+    if state is None:
+        if not os.path.exists(save_name):
+            print('Save file not found! Starting a new game.')
+            return None
         return False
 
-    
+    apply_snapshot(ui_manager, state)
+    last_time = state["timestamp"]
+    if number == 0:
+        # the journal belongs to the newest snapshot, on top of a backup it would double count
+        last_time = replay_journal(ui_manager, save_name, since=last_time) or last_time
+    else:
+        print(f"Recovered {save_name} from backup {number}")
+    # credit the time away, the rates were recomputed above so prestige upgrades are included
+    report = offline_progress.credit(ui_manager, time.time() - last_time)
 
-                # if current_time - self.last_time >= 1:
-                #     self.ui_manager.cookie_count += self.ui_manager.cookies_per_second()
-                #     self.last_time = current_time
+    # Trigger popup with bonus cookies
+    ui_manager.show_popup_cookie_earned = True
+    ui_manager.bonus_cookies = report.cookies
+    ui_manager.offline_report = report
+    return True
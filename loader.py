@@ -0,0 +1,97 @@
+'''
+Module Name: loader.py
+Purpose: Decodes images and sounds on a thread pool so the first frame does not wait for them, finished assets are handed to their owner on the main thread
+Inputs: Paths of the image and sound files to load
+Output: None
+Additional code sources: https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# decoding runs on a worker thread, it only touches the file and never the display
+def decode_image(path):
+    with open(path, 'rb') as file:
+        data = file.read()
+    return pygame.image.load(io.BytesIO(data), os.path.basename(path))
+
+def decode_sound(path):
+    return pygame.mixer.Sound(path)
+
+# Class for the background loader, each asset is queued once by key and decoded once
+# the owner's handoff (e.g. convert_alpha and storing the surface) runs on the main thread in poll or wait
+class AssetLoader:
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.executor = None # started by the first request
+        self.jobs = {} # key -> (Future, handoff) for assets not handed off yet, in the order they were queued
+        self.loaded = set() # keys already handed off
+        self.submitted = 0
+        self.completed = 0
+
+    def request(self, key, decode, path, handoff):
+        """Queues decode(path) unless key is already queued or loaded, handoff(result) runs on the main thread. Returns True if queued."""
+        if key in self.jobs or key in self.loaded:
+            return False
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+        self.jobs[key] = (self.executor.submit(decode, path), handoff)
+        self.submitted += 1
+        return True
+
+    def image(self, key, path, handoff):
+        return self.request(("image", key), decode_image, path, handoff)
+
+    def sound(self, key, path, handoff):
+        return self.request(("sound", key), decode_sound, path, handoff)
+
+    def pending(self, key):
+        """Returns True if key is queued or decoding and has not been handed off yet."""
+        return key in self.jobs
+
+    # runs the owner's handoff for a finished job, errors from the worker are raised here on the main thread
+    def _finish(self, key):
+        future, handoff = self.jobs.pop(key)
+        self.loaded.add(key)
+        self.completed += 1
+        handoff(future.result())
+
+    def poll(self):
+        """Hands off every job that has finished decoding, called once a frame. Returns how many were handed off."""
+        finished = [key for key, (future, _) in self.jobs.items() if future.done()]
+        for key in finished:
+            self._finish(key)
+        return len(finished)
+
+    def wait(self, key):
+        """Blocks until key has decoded and hands it off, used when an asset is needed before poll got to it."""
+        if key in self.jobs:
+            self.jobs[key][0].result()
+            self._finish(key)
+
+    def forget(self, key):
+        """Lets key be requested again, used by owners that drop a decoded asset to save memory."""
+        self.loaded.discard(key)
+
+    def progress(self):
+        """Returns (assets handed off, assets requested)."""
+        return self.completed, self.submitted
+
+    def idle(self):
+        return not self.jobs
+
+    def shutdown(self):
+        """Drops the queued jobs and waits for the ones decoding, called before pygame quits."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.jobs.clear()
+
+# process-wide loader shared by the asset cache and the sound manager
+asset_loader = AssetLoader()
@@ -9,11 +9,13 @@ Date: 10/26/2024
 Last Modified: 10/26/2024
 '''
 
+import sys
+
 from game import Game
 
-# runs the game
+# runs the game, an optional number on the command line seeds the random events
 def main():
-    game = Game()
+    game = Game(seed=int(sys.argv[1]) if len(sys.argv) > 1 else None)
     game.run()
 
 # ensures this is the main entrypoint for the program
@@ -0,0 +1,170 @@
+'''
+Module Name: music.py
+Purpose: Background music played from tracks decoded once into memory, with pause and resume at the same position, playlists and crossfades
+Inputs: Music files under assets/sounds, decoded on the asset loader's threads
+Output: None
+Additional code sources: https://www.pygame.org/docs/ref/mixer.html#pygame.mixer.Channel
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import collections
+import time
+
+import pygame
+
+from assets import asset_key
+from loader import decode_sound
+
+MUSIC_CACHE_BYTES = 64 * 1024 * 1024 # decoded tracks kept in memory, a 70 second track is about 12 MB
+CROSSFADE_MS = 2000
+
+# bytes one second of decoded audio takes in the mixer's format
+def bytes_per_second():
+    frequency, size, channels = pygame.mixer.get_init()
+    return frequency * channels * abs(size) // 8
+
+# Class for the music player, tracks play on two reserved mixer channels so one can fade in while the other fades out
+# nothing here waits for a decode, a track that is not ready yet starts from update once the loader hands it over
+class MusicPlayer:
+    def __init__(self, playlist, loader=None, cache_bytes=MUSIC_CACHE_BYTES, crossfade_ms=CROSSFADE_MS, clock=time.monotonic):
+        self.playlist = list(playlist) # paths played in order, wrapping around to the first
+        self.index = 0 # playlist entry playing or about to play
+        self.loader = loader # AssetLoader that decodes the tracks, None to decode them on the spot
+        self.cache = collections.OrderedDict() # path -> decoded Sound, least recently played first
+        self.cache_bytes = cache_bytes
+        self.crossfade_ms = crossfade_ms
+        self.clock = clock
+        self.channels = [] # the two mixer channels, set by attach
+        self.current = 0 # index in channels of the one playing
+        self.track = None # path playing, None when stopped
+        self.started = 0.0 # clock time the track's position 0 would have played at
+        self.paused_at = None # clock time of the pause, None while playing
+        self.queued = None # (path, offset, fade) waiting for its decode
+
+    def attach(self, channels):
+        """Gives the player the mixer channels it plays on, two for crossfades."""
+        self.channels = list(channels)
+
+    # asks for the decoded track, returns it if it is already in memory
+    def _request(self, path):
+        sound = self.cache.get(path)
+        if sound is not None:
+            self.cache.move_to_end(path)
+            return sound
+        if self.loader is None:
+            self._store(path, pygame.mixer.Sound(path))
+            return self.cache[path]
+        # keyed apart from the sound effects, a file used for both is still handed to both
+        self.loader.request(("music", asset_key(path)), decode_sound, path, lambda sound: self._store(path, sound))
+        return None
+
+    # keeps a decoded track, dropping the least recently played ones (never the one playing) past the memory cap
+    def _store(self, path, sound):
+        self.cache[path] = sound
+        total = sum(self._size(track) for track in self.cache.values())
+        for old in list(self.cache):
+            if total <= self.cache_bytes or old == path:
+                break
+            if old == self.track:
+                continue
+            total -= self._size(self.cache.pop(old))
+            if self.loader is not None:
+                self.loader.forget(("music", asset_key(old)))
+
+    def _size(self, sound):
+        return int(sound.get_length() * bytes_per_second())
+
+    def play(self, path=None, offset=0.0, fade=True):
+        """Plays path (the current playlist entry if None) from offset seconds, crossfading from the track playing."""
+        if path is None:
+            path = self.playlist[self.index]
+        self.queued = (path, offset, fade)
+        if self._request(path) is not None:
+            self._start()
+
+    # starts the queued track on the idle channel and fades the other one out
+    def _start(self):
+        path, offset, fade = self.queued
+        self.queued = None
+        sound = self.cache[path]
+        if offset > 0:
+            # seeking copies the decoded samples from offset on, the file is not read again
+            raw = sound.get_raw()
+            frame = bytes_per_second() // pygame.mixer.get_init()[0]
+            start = min(len(raw), int(offset * bytes_per_second()) // frame * frame)
+            sound = pygame.mixer.Sound(buffer=memoryview(raw)[start:])
+        fade_ms = self.crossfade_ms if fade and self.track is not None else 0
+        old = self.channels[self.current]
+        self.current = 1 - self.current
+        if fade_ms:
+            old.fadeout(fade_ms)
+        else:
+            old.stop()
+        self.channels[self.current].play(sound, fade_ms=fade_ms)
+        self.track = path
+        self.started = self.clock() - offset
+        self.paused_at = None
+
+    def update(self):
+        """Called once a frame: starts a queued track once decoded and crossfades into the next entry before the track ends."""
+        if self.paused_at is not None:
+            return
+        if self.queued is not None:
+            if self.queued[0] in self.cache:
+                self._start()
+            return
+        if self.track is None:
+            return
+        length = self.cache[self.track].get_length()
+        if self.position() >= length - self.crossfade_ms / 1000:
+            self.next()
+
+    def next(self):
+        """Crossfades into the next playlist entry."""
+        self.index = (self.index + 1) % len(self.playlist)
+        self.play()
+
+    def pause(self):
+        """Pauses both channels where they are, resume carries on from the same position."""
+        if self.track is None:
+            self.queued = None # nothing has started yet, the next play queues it again
+            return
+        if self.paused_at is not None:
+            return
+        for channel in self.channels:
+            channel.pause()
+        self.paused_at = self.clock()
+
+    def resume(self):
+        if self.paused_at is None:
+            return
+        for channel in self.channels:
+            channel.unpause()
+        self.started += self.clock() - self.paused_at
+        self.paused_at = None
+
+    def is_paused(self):
+        return self.paused_at is not None
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
+        self.track = None
+        self.queued = None
+        self.paused_at = None
+
+    def seek(self, seconds):
+        """Moves the current track to seconds in, from the decoded samples."""
+        if self.track is not None:
+            paused = self.paused_at is not None
+            self.play(self.track, seconds, fade=False)
+            if paused:
+                self.pause()
+
+    def position(self):
+        """Returns how many seconds into the current track playback is."""
+        if self.track is None:
+            return 0.0
+        return (self.paused_at if self.paused_at is not None else self.clock()) - self.started
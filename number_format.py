@@ -0,0 +1,113 @@
+'''
+Module Name: number_format.py
+Purpose: Formats cookie counts for display (Latin suffixes, scientific or engineering notation) from a precomputed suffix table with a cache of recent results
+Inputs: None
+Output: None
+Additional code sources: https://en.wikipedia.org/wiki/Names_of_large_numbers
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+from collections import OrderedDict
+import math
+
+from bignum import log10
+
+SHORT = "short" # 1.234 Million
+SCIENTIFIC = "scientific" # 1.234e+06
+ENGINEERING = "engineering" # 1.234e6, 12.345e6, 123.456e6
+NOTATIONS = [SHORT, SCIENTIFIC, ENGINEERING]
+
+SUFFIX_START = 1_000_000 # numbers below this are shown in full, in every notation
+LAST_ILLION = 101 # uncentillion, the largest suffix in the table, it covers every float up to the float range (about 1.8e308)
+
+# builds the suffix for 10 ^ (3 x illion + 3), e.g. 1 -> million, 2 -> billion, 21 -> unvigintillion
+def _build_suffix(illion):
+    first_latin_units = ["m", "b", "tr", "quadr", "quint", "sext", "sept", "oct", "non"]
+    n_latin_units = ["un", "duo", "tre", "quattuor", "quin", "se", "septen", "octo", "novem"]
+    latin_tens = ["dec", "vigint", "trigint", "quadragint", "quinquagint", "sexagint", "septuagint", "octogint", "nonagint"]
+    if illion < 10:
+        return f"{first_latin_units[illion - 1]}illion"
+    if illion < 100:
+        tens, units = divmod(illion, 10)
+        return f"{n_latin_units[units - 1] if units else ''}{latin_tens[tens - 1]}illion"
+    return f"{n_latin_units[illion - 101] if illion > 100 else ''}centillion"
+
+# built once, SUFFIXES[i] and SCALES[i] are the capitalized suffix and divisor for illion i (index 0 is unused)
+SUFFIXES = [""] + [_build_suffix(illion).capitalize() for illion in range(1, LAST_ILLION + 1)]
+SCALES = [float(10 ** ((illion + 1) * 3)) for illion in range(LAST_ILLION + 1)]
+
+# Class that turns numbers into display strings, results are kept in an LRU cache
+# since the same prices and rates are drawn every frame
+class NumberFormatter:
+    def __init__(self, notation=SHORT, max_entries=256):
+        self.notation = notation
+        self.max_entries = max_entries # oldest results are dropped once the cache is full
+        self.cache = OrderedDict() # (number, notation) -> text
+        self.hits = 0
+        self.misses = 0
+
+    def format(self, num):
+        """Returns num as display text in the current notation."""
+        key = (num, self.notation)
+        try:
+            text = self.cache.get(key)
+        except TypeError: # unhashable number types are formatted without the cache
+            return self._format(num, self.notation)
+        if text is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return text
+        self.misses += 1
+        text = self._format(num, self.notation)
+        self.cache[key] = text
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return text
+
+    def _format(self, num, notation):
+        if num < SUFFIX_START: # no need for a suffix if less than 1 million
+            return f"{num:.1f}"
+        if notation == SCIENTIFIC:
+            return f"{num:.3e}"
+        # Get the base-10 exponent, bignum.log10 also works on balances past the float range
+        exponent = log10(num)
+        if not math.isfinite(exponent):
+            return "Infinity"
+        if notation == ENGINEERING:
+            return self._engineering(exponent)
+        # Calculate the index for suffix (group every 3 powers of 10)
+        illion = int(exponent // 3) - 1
+        if illion > LAST_ILLION:
+            return f"{num:.3e}" # past the last Latin suffix, only BigNums get here
+        return f"{num / SCALES[illion]:.3f} {SUFFIXES[illion]}"
+
+    # mantissa between 1 and 1000 with an exponent that is a multiple of 3, worked out from the logarithm
+    # so it also works for BigNums
+    def _engineering(self, exponent):
+        power = int(exponent // 3) * 3
+        mantissa = round(10 ** (exponent - power), 3)
+        if mantissa >= 1000:
+            mantissa /= 1000
+            power += 3
+        return f"{mantissa:.3f}e{power}"
+
+    def next_notation(self):
+        """Switches to the next notation in NOTATIONS and returns it."""
+        self.notation = NOTATIONS[(NOTATIONS.index(self.notation) + 1) % len(NOTATIONS)]
+        return self.notation
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self):
+        """Returns the hit/miss counters and the number of cached results."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache)}
+
+# process-wide formatter used by the UI
+number_formatter = NumberFormatter()
+
+# formats a number for display with the shared formatter
+def format_number(num):
+    return number_formatter.format(num)
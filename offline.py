@@ -0,0 +1,119 @@
+'''
+Module Name: offline.py
+Purpose: Credits the cookies earned while the game was closed, in closed form so any absence costs the same to compute
+Inputs: Seconds since the save was written and the loaded economy
+Output: An OfflineReport with the cookies earned (and purchases made, if auto-buy is on)
+Additional code sources: https://en.wikipedia.org/wiki/Exponential_decay#Half-life
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import math
+
+from bignum import BigNum, fit
+from events import expected_multiplier
+
+OFFLINE_CAP = 7 * 24 * 3600 # seconds, time away past this earns nothing
+EVENTS_MODIFIER = "offline events" # modifier holding the expected value of the CPS events while earnings are worked out
+
+# efficiency curves, each maps time away to the share of production credited
+# effective_seconds(t) is the integral of the efficiency from 0 to t, so earnings are just rate x effective_seconds
+
+# Class for a curve that credits the same share of production the whole time
+class ConstantEfficiency:
+    def __init__(self, efficiency=1.0):
+        self.efficiency = efficiency
+
+    def effective_seconds(self, seconds):
+        return self.efficiency * seconds
+
+# Class for a curve made of flat steps, e.g. [(3600, 1.0), (86400, 0.5)] is full rate for an hour,
+# half rate until a day has passed and after (default 0) from then on
+class StepEfficiency:
+    def __init__(self, steps, after=0.0):
+        self.steps = sorted(steps) # (end of the step in seconds, efficiency)
+        self.after = after
+
+    def effective_seconds(self, seconds):
+        total = 0.0
+        start = 0.0
+        for end, efficiency in self.steps:
+            if seconds <= end:
+                return total + efficiency * (seconds - start)
+            total += efficiency * (end - start)
+            start = end
+        return total + self.after * (seconds - start)
+
+# Class for a curve that starts at full rate and halves every half_life seconds, never going below floor
+# efficiency(t) = floor + (1 - floor) x 2 ^ (-t / half_life)
+class DecayEfficiency:
+    def __init__(self, half_life=8 * 3600, floor=0.1):
+        self.half_life = half_life
+        self.floor = floor
+
+    def effective_seconds(self, seconds):
+        tau = self.half_life / math.log(2)
+        return self.floor * seconds + (1 - self.floor) * tau * -math.expm1(-seconds / tau)
+
+# Class for the result of crediting one absence
+class OfflineReport:
+    def __init__(self, elapsed, credited, effective, cookies, purchases=()):
+        self.elapsed = elapsed # seconds since the save
+        self.credited = credited # seconds that count, elapsed limited to the cap
+        self.effective = effective # seconds of full rate production the curve works out to
+        self.cookies = cookies # cookies earned
+        self.purchases = list(purchases) # (effective time, item name, quantity, price) bought by the auto-buy policy
+
+# Class that works out offline earnings for an economy
+class OfflineProgress:
+    def __init__(self, cap=OFFLINE_CAP, curve=None, clicks_per_second=0, simulate_events=False, policy=None, max_purchases=1000):
+        self.cap = cap # None for no cap
+        self.curve = curve if curve is not None else DecayEfficiency()
+        self.clicks_per_second = clicks_per_second # clicks assumed while away, e.g. for an auto clicker, 0 for idle
+        self.simulate_events = simulate_events # adds the expected value of the random events (data/events.json), gambling needs the player
+        self.policy = policy # optional simulator policy to keep buying while away, see simulator.py
+        self.max_purchases = max_purchases
+
+    # clicks per second, scaled by the expected value of the CPC events
+    def click_rate(self):
+        return self.clicks_per_second * (expected_multiplier("cpc") if self.simulate_events and self.clicks_per_second else 1)
+
+    def income(self, economy):
+        """Cookies per second at full efficiency, prestige upgrades and active modifiers are part of the economy's CPS."""
+        clicks = self.click_rate()
+        if not clicks:
+            return economy.cookies_per_second()
+        return fit(BigNum(economy.cookie_per_click) * clicks + economy.cookies_per_second())
+
+    def credit(self, economy, elapsed):
+        """Adds the earnings for elapsed seconds away to the economy's balance and returns an OfflineReport."""
+        elapsed = max(0.0, elapsed) # a clock that went backwards earns nothing
+        credited = elapsed if self.cap is None else min(elapsed, self.cap)
+        effective = self.curve.effective_seconds(credited)
+        if self.simulate_events:
+            economy.add_modifier(EVENTS_MODIFIER, "cps", expected_multiplier("cps"))
+        try:
+            start = economy.cookie_count
+            if self.policy is None:
+                economy.cookie_count = fit(start + round(BigNum(self.income(economy)) * effective))
+                return OfflineReport(elapsed, credited, effective, fit(economy.cookie_count - start))
+            return self._credit_with_purchases(economy, elapsed, credited, effective)
+        finally:
+            economy.remove_modifier(EVENTS_MODIFIER)
+
+    # The efficiency scales the whole income by the same factor at each moment, so measured in effective
+    # seconds the economy runs at full rate. The simulator can then jump from purchase to purchase as usual.
+    def _credit_with_purchases(self, economy, elapsed, credited, effective):
+        from simulator import Simulator
+        # events are already averaged into the CPS modifier above, the simulator does not run them again on top
+        simulator = Simulator(economy, clicks_per_second=self.click_rate(), events=False)
+        start = economy.cookie_count
+        result = simulator.run(effective / 3600, self.policy, sample_interval=0, max_purchases=self.max_purchases)
+        if result.times[-1] < effective: # the run stopped at max_purchases, the rest of the time is plain production
+            economy.cookie_count = fit(economy.cookie_count + round(BigNum(simulator.income()) * (effective - result.times[-1])))
+        spent = sum(BigNum(price) for _, _, _, price in result.purchases)
+        return OfflineReport(elapsed, credited, effective, fit(economy.cookie_count - start + spent), result.purchases)
+
+# settings used by load_game.load
+offline_progress = OfflineProgress()
@@ -0,0 +1,115 @@
+'''
+Module Name: pack_assets.py
+Purpose: Offline packing step that combines the small sprites listed in data/assets.json into one atlas image with a precomputed layout
+Inputs: data/assets.json, the sprite files under assets/, optional --check to only verify the packed atlas is current
+Output: The atlas image and layout named in the manifest (assets/atlas/sprites.png and data/atlas.json)
+Additional code sources: https://en.wikipedia.org/wiki/Bin_packing_problem#Shelf_algorithms
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import pygame
+
+from assets import ROOT, MANIFEST_FILE, asset_key, load_manifest
+
+# expands the manifest's patterns into the sorted asset keys to pack, lazily loaded files are left out
+def packed_keys(manifest):
+    lazy = set(manifest.get("lazy", []))
+    keys = []
+    for pattern in manifest["packed"]:
+        matches = sorted(glob.glob(os.path.join(ROOT, pattern)))
+        if not matches:
+            raise ValueError(f"manifest pattern {pattern!r} matches no files")
+        for match in matches:
+            key = asset_key(match)
+            if key in lazy:
+                raise ValueError(f"{key} is listed as both packed and lazy")
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+def file_hash(key):
+    with open(os.path.join(ROOT, key), 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+# shelf packing: the tallest sprites go first, each row is filled left to right until max_width
+# and the next row starts under the tallest sprite of the current one
+def shelf_layout(sizes, max_width, padding=1):
+    order = sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key))
+    rects = {}
+    x = y = shelf_height = page_width = 0
+    for key in order:
+        width, height = sizes[key]
+        if width + 2 * padding > max_width:
+            raise ValueError(f"{key} is {width} pixels wide, wider than the atlas ({max_width})")
+        if x + width + 2 * padding > max_width:
+            y += shelf_height
+            x = shelf_height = 0
+        rects[key] = (x + padding, y + padding, width, height)
+        x += width + 2 * padding
+        shelf_height = max(shelf_height, height + 2 * padding)
+        page_width = max(page_width, x)
+    return rects, (page_width, y + shelf_height)
+
+# packs the sprites and writes the atlas image and its layout
+def pack(manifest_path=MANIFEST_FILE):
+    manifest = load_manifest(manifest_path)
+    settings = manifest["atlas"]
+    keys = packed_keys(manifest)
+    images = {key: pygame.image.load(os.path.join(ROOT, key)) for key in keys}
+    rects, size = shelf_layout({key: image.get_size() for key, image in images.items()},
+                               settings.get("max_width", 256), settings.get("padding", 1))
+    page = pygame.Surface(size, pygame.SRCALPHA)
+    page.fill((0, 0, 0, 0))
+    for key, image in images.items():
+        # BLEND_RGBA_MAX copies the pixels as they are, a normal blit would blend partly transparent ones into the empty page
+        page.blit(image.convert_alpha(page), rects[key][:2], special_flags=pygame.BLEND_RGBA_MAX)
+    image_path = os.path.join(ROOT, settings["image"])
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    pygame.image.save(page, image_path)
+    layout = {"image": settings["image"], "size": list(size),
+              "sprites": {key: {"rect": list(rects[key]), "sha1": file_hash(key)} for key in keys}}
+    # one line per sprite keeps the layout readable in a diff
+    sprites = ",\n".join(f"    {json.dumps(key)}: {json.dumps(entry)}" for key, entry in layout["sprites"].items())
+    with open(os.path.join(ROOT, settings["layout"]), 'w') as file:
+        file.write(f'{{\n  "image": {json.dumps(layout["image"])},\n  "size": {json.dumps(layout["size"])},\n  "sprites": {{\n{sprites}\n  }}\n}}\n')
+    return layout
+
+# returns a list of problems with the packed atlas, empty when it matches the sprites on disk
+def check(manifest_path=MANIFEST_FILE):
+    manifest = load_manifest(manifest_path)
+    layout_path = os.path.join(ROOT, manifest["atlas"]["layout"])
+    if not os.path.exists(layout_path) or not os.path.exists(os.path.join(ROOT, manifest["atlas"]["image"])):
+        return ["the atlas has not been packed"]
+    with open(layout_path, 'r') as file:
+        sprites = json.load(file)["sprites"]
+    keys = packed_keys(manifest)
+    problems = [f"{key} is not in the atlas" for key in keys if key not in sprites]
+    problems += [f"{key} is in the atlas but no longer in the manifest" for key in sprites if key not in keys]
+    problems += [f"{key} changed since the atlas was packed" for key in keys
+                 if key in sprites and sprites[key]["sha1"] != file_hash(key)]
+    return problems
+
+# run after adding or editing a sprite: python pack_assets.py (or --check to verify without writing)
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN) # convert_alpha needs a display
+    if "--check" in sys.argv[1:]:
+        problems = check()
+        for problem in problems:
+            print(problem)
+        print("atlas is up to date" if not problems else "run pack_assets.py to repack the atlas")
+        sys.exit(1 if problems else 0)
+    layout = pack()
+    width, height = layout["size"]
+    print(f"packed {len(layout['sprites'])} sprites into {layout['image']} ({width}x{height})")
+
+if __name__ == '__main__':
+    main()
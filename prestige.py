@@ -10,8 +10,11 @@ Last Modified: 12/5/2024
 '''
 
 import pygame
-from buttons import LargeButton
+from widgets import Popup, ButtonRow
 from shop import ShopUpgrade
+from fonts import get_font, render_text
+from autosave import autosave
+from bignum import fit
 
 class Prestige:
     def __init__(self):
@@ -20,67 +23,23 @@ class Prestige:
         self.show_prestige_menu = False
         self.show_prestige_verify = False
         self.prestige_shop = Prestige_Shop()
+        self.pick = None # label of the button clicked in one of the prestige popups
+        # popups are built once, their buttons are laid out when the window size changes
+        self.menu_popup = Popup("Prestige Menu", [ButtonRow(["Prestige", "Close Menu"]), self.prestige_shop.button_row],
+                                self.on_click, draw_content=self.draw_menu_content)
+        self.verify_popup = Popup("Are you sure?", [ButtonRow(["Confirm", "Cancel"])], self.on_click)
 
     def prestige_check_menu(self, ui_manager):
-        popup_width = int(ui_manager.WIDTH * 0.7)
-        popup_height = int(ui_manager.HEIGHT * 1)
-        popup_x = (ui_manager.WIDTH - popup_width) 
-        popup_y = (ui_manager.HEIGHT - popup_height) // 2  # Center the popup vertically
-        
-        # Draw the popup background
-        pygame.draw.rect(ui_manager.screen, (200, 200, 200), (popup_x, popup_y, popup_width, popup_height))
-
-        title_font = pygame.font.SysFont(None, int(popup_height * 0.1))
-        title_text = "Are you sure?"
-        ui_manager.draw_text(title_text, title_font, (0, 0, 0), popup_x + popup_width // 2 - title_font.size(title_text)[0] // 2, popup_y + 10)
-
-        button_labels = ["Confirm", "Cancel"]
-
-        # Set button properties
-        button_width = int(popup_width * 0.2)  # Adjust the button width based on the popup size
-        button_height = int(popup_height * 0.1)  # Set a reasonable button height
-
-        # Calculate the vertical position of the buttons (one row of buttons at the bottom)
-        button_y = popup_y + popup_height - button_height - 10
-        
-        # Space out the buttons horizontally based on the number of buttons
-        spacing = (popup_width - len(button_labels) * button_width) // (len(button_labels) + 1)  # Space between buttons
-
-        # Loop through the button labels and create the buttons
-        for index, label in enumerate(button_labels):
-            # Calculate the x-position of the current button
-            button_x = popup_x + (index + 1) * spacing + index * button_width
-            button = LargeButton(ui_manager.screen, button_x, button_y, label, button_width, button_height)
-            button.draw(ui_manager.screen)
-
-            # Handle the button click based on its label
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()[0]  # Left mouse button pressed (0 = left, 1 = middle, 2 = right)
-
-            # Ensure the click is only handled once (we prevent double-clicking the button)
-            if button.is_clicked(mouse_pos) and mouse_pressed:
-                if not hasattr(self, '_button_clicked') or not self._button_clicked:
-                    self._button_clicked = True  # Lock the button to avoid multiple triggers
-                    ui_manager.sound_manager.play_sound("menu-click")
-                    if label == "Confirm":
-                        if ui_manager.cookie_count > 10000000:
-                            self.prestige(ui_manager)
-                        self.show_prestige_verify = False
-                    elif label == 'Cancel':
-                        self.show_prestige_verify = False
-                else:
-                    # If the button was already clicked, do nothing (debounced)
-                    pass
-
-            # Reset the click lock when the mouse button is released
-            if not mouse_pressed:
-                if hasattr(self, '_button_clicked') and self._button_clicked:
-                    self._button_clicked = False  # Unlock the button when the button is released
+        self.verify_popup.draw(ui_manager.screen, ui_manager.WIDTH, ui_manager.HEIGHT)
 
     def prestige(self, ui_manager):
-        self.golden_cookies += ui_manager.cookie_count / 10000000
+        self.golden_cookies = fit(self.golden_cookies + ui_manager.cookie_count / 10000000)
+        self.prestige_count += 1
         ui_manager.cookie_count = 0
         ui_manager.upgrades_acquired = []
+        ui_manager.refresh_rates()
+        ui_manager.achievement_manager.update("prestige", self.prestige_count)
+        autosave.notify("prestige")
 
     def handle_prestige_click(self):
         self.show_prestige_menu = not self.show_prestige_menu  # Toggles the prestige menu
@@ -88,71 +47,55 @@ class Prestige:
     def draw_prestige_menu(self, ui_manager):
             if self.show_prestige_verify:
                 self.prestige_check_menu(ui_manager)
+                return True
             elif self.show_prestige_menu:
-                popup_width = int(ui_manager.WIDTH * 0.7)
-                popup_height = int(ui_manager.HEIGHT * 1)
-                popup_x = (ui_manager.WIDTH - popup_width) 
-                popup_y = (ui_manager.HEIGHT - popup_height) // 2  # Center the popup vertically
-                
-                # Draw the popup background
-                pygame.draw.rect(ui_manager.screen, (200, 200, 200), (popup_x, popup_y, popup_width, popup_height))
-
-                # Draw the title of the popup
-                title_font = pygame.font.SysFont(None, int(popup_height * 0.1))
-                title_text = "Prestige Menu"
-                ui_manager.draw_text(title_text, title_font, (0, 0, 0), popup_x + popup_width // 2 - title_font.size(title_text)[0] // 2, popup_y + 10)
-
-                # Define the buttons and their labels
-                button_labels = ["Prestige", "Close Menu"]
-                
-                # Set button properties
-                button_width = int(popup_width * 0.2)  # Adjust the button width based on the popup size
-                button_height = int(popup_height * 0.1)  # Set a reasonable button height
-
-                # Calculate the vertical position of the buttons (one row of buttons at the bottom)
-                button_y = popup_y + popup_height - button_height - 10
-                
-                # Space out the buttons horizontally based on the number of buttons
-                spacing = (popup_width - len(button_labels) * button_width) // (len(button_labels) + 1)  # Space between buttons
-
-                # Loop through the button labels and create the buttons
-                for index, label in enumerate(button_labels):
-                    # Calculate the x-position of the current button
-                    button_x = popup_x + (index + 1) * spacing + index * button_width
-                    button = LargeButton(ui_manager.screen, button_x, button_y, label, button_width, button_height)
-                    button.draw(ui_manager.screen)
-
-                    # Handle the button click based on its label
-                    mouse_pos = pygame.mouse.get_pos()
-                    mouse_pressed = pygame.mouse.get_pressed()[0]  # Left mouse button pressed (0 = left, 1 = middle, 2 = right)
-
-                    # Ensure the click is only handled once (we prevent double-clicking the button)
-                    if button.is_clicked(mouse_pos) and mouse_pressed:
-                        if not hasattr(self, '_button_clicked') or not self._button_clicked:
-                            self._button_clicked = True  # Lock the button to avoid multiple triggers
-                            ui_manager.sound_manager.play_sound("menu-click")
-                            if label == "Close Menu":
-                                self.show_prestige_menu = False  # Close the pop-up when the button is clicked
-                            elif label == 'Prestige':
-                                self.show_prestige_verify = True
-                        else:
-                            # If the button was already clicked, do nothing (debounced)
-                            pass
-
-                    # Reset the click lock when the mouse button is released
-                    if not mouse_pressed:
-                        if hasattr(self, '_button_clicked') and self._button_clicked:
-                            self._button_clicked = False  # Unlock the button when the button is released
-
-
-                font_size = int(ui_manager.WIDTH * 0.02)  # Dynamic font size based on width
-                font = pygame.font.SysFont(None, font_size)
-                ui_manager.draw_text(f"Golden Cookies: {self.golden_cookies:.2f}", font, (0,0,0), popup_x + 10, popup_y+100)
-
-                self.golden_cookies = self.prestige_shop.draw_shop_items(ui_manager, self.golden_cookies)
+                self.menu_popup.draw(ui_manager.screen, ui_manager.WIDTH, ui_manager.HEIGHT)
                 return True
             else:
                 return False
+
+    # draws the golden cookie balance and the prestige shop title inside the prestige menu
+    def draw_menu_content(self, screen, rect):
+        width = screen.get_width()
+        font = get_font(int(width * 0.02))  # Dynamic font size based on width
+        screen.blit(render_text(f"Golden Cookies: {self.golden_cookies:.2f}", font, (0,0,0)), (rect.x + 10, rect.y + 100))
+
+        title_font = get_font(int(rect.height * 0.1))
+        title_surface = render_text("Prestige Shop:", title_font, (0, 0, 0))
+        screen.blit(title_surface, (rect.x + rect.width // 2 - title_surface.get_width() // 2, rect.y + 500))
+
+    def on_click(self, label):
+        self.pick = label
+
+    # handles a click on whichever prestige popup is open, returns True if the popup took the click
+    def handle_click(self, ui_manager, mouse_pos):
+        if self.show_prestige_verify:
+            popup = self.verify_popup
+        elif self.show_prestige_menu:
+            popup = self.menu_popup
+        else:
+            return False
+        self.pick = None
+        handled = popup.handle_click(mouse_pos)
+        if self.pick is None:
+            return handled
+        if popup is self.verify_popup:
+            ui_manager.sound_manager.play_sound("menu-click")
+            if self.pick == "Confirm":
+                if ui_manager.cookie_count > 10000000:
+                    self.prestige(ui_manager)
+                self.show_prestige_verify = False
+            elif self.pick == 'Cancel':
+                self.show_prestige_verify = False
+        elif self.pick == "Close Menu":
+            ui_manager.sound_manager.play_sound("menu-click")
+            self.show_prestige_menu = False  # Close the pop-up when the button is clicked
+        elif self.pick == 'Prestige':
+            ui_manager.sound_manager.play_sound("menu-click")
+            self.show_prestige_verify = True
+        else:
+            self.golden_cookies = self.prestige_shop.buy(self.pick, ui_manager, self.golden_cookies)
+        return handled
             
     def get_shop_items(self):
         return self.prestige_shop.get_shop_items()
@@ -164,57 +107,20 @@ class Prestige_Shop:
             'Golden Grandma: 3': ShopUpgrade("Golden Grandma", 3, 10000, None),
             'Golden Factory: 10': ShopUpgrade("Golden Factory", 10, 1000000, None)
         }
-    
-    def draw_shop_items(self, ui_manager, golden_cookies):
-        popup_width = int(ui_manager.WIDTH * 0.7)
-        popup_height = int(ui_manager.HEIGHT * 1)
-        popup_x = (ui_manager.WIDTH - popup_width) 
-        popup_y = (ui_manager.HEIGHT - popup_height) // 2  # Center the popup vertically
-
-        # Set button properties
-        button_width = int(popup_width * 0.3)  # Adjust the button width based on the popup size
-        button_height = int(popup_height * 0.1)  # Set a reasonable button height
-
-        # Calculate the vertical position of the buttons (one row of buttons at the bottom)
-        button_y = popup_y + popup_height - button_height - 300
-        
-        # Space out the buttons horizontally based on the number of buttons
-        spacing = (popup_width - len(self.prestige_upgrades) * button_width) // (len(self.prestige_upgrades) + 1)  # Space between buttons
-
-        title_font = pygame.font.SysFont(None, int(popup_height * 0.1))
-        title_text = "Prestige Shop:"
-        ui_manager.draw_text(title_text, title_font, (0, 0, 0), popup_x + popup_width // 2 - title_font.size(title_text)[0] // 2, popup_y + 500)
-
-
-        # Loop through the button labels and create the buttons
-        for index, (key, item) in enumerate(self.prestige_upgrades.items()):
-            # Calculate the x-position of the current button
-            button_x = popup_x + (index + 1) * spacing + index * button_width
-            button = LargeButton(ui_manager.screen, button_x, button_y, key, button_width, button_height)
-            button.draw(ui_manager.screen)
-
-            # Handle the button click based on its label
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()[0]  # Left mouse button pressed (0 = left, 1 = middle, 2 = right)
-
-            # Ensure the click is only handled once (we prevent double-clicking the button)
-            if button.is_clicked(mouse_pos) and mouse_pressed:
-                if not hasattr(self, '_button_clicked') or not self._button_clicked:
-                    self._button_clicked = True  # Lock the button to avoid multiple triggers
-                    price = int(item.base_cost)
-                    print(golden_cookies, price)
-                    if golden_cookies > price:
-                        ui_manager.sound_manager.play_sound("shop")
-                        item.purchased_count += 1
-                        golden_cookies -= price
-                else:
-                    # If the button was already clicked, do nothing (debounced)
-                    pass
-
-            # Reset the click lock when the mouse button is released
-            if not mouse_pressed:
-                if hasattr(self, '_button_clicked') and self._button_clicked:
-                    self._button_clicked = False  # Unlock the button when the button is released
+        # one button per upgrade, laid out by the prestige menu popup
+        self.button_row = ButtonRow(list(self.prestige_upgrades), width=0.3, bottom_margin=300)
+
+    # buys the upgrade shown on the button with the given key, returns the remaining golden cookies
+    def buy(self, key, ui_manager, golden_cookies):
+        item = self.prestige_upgrades[key]
+        price = int(item.base_cost)
+        print(golden_cookies, price)
+        if golden_cookies > price:
+            ui_manager.sound_manager.play_sound("shop")
+            item.purchased_count += 1
+            golden_cookies -= price
+            if item.cps is not None:
+                ui_manager.cps_cache.add(item.cps) # prestige upgrades add to cookies per second
         return golden_cookies
     
     def get_shop_items(self):
@@ -0,0 +1,85 @@
+'''
+Module Name: pricing.py
+Purpose: Closed form shop pricing, the cost of buying several items at once and the most items a balance can afford
+Inputs: None
+Output: None
+Additional code sources: https://en.wikipedia.org/wiki/Arithmetico-geometric_sequence
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import math
+
+from bignum import BigNum, fit, log
+
+# price = (base + step x owned) x 1.15 ^ (owned)
+PRICE_GROWTH = 1.15
+# the formulas run on plain floats and are redone with BigNum powers only when a price passes the float range
+_BIG_GROWTH = BigNum(PRICE_GROWTH)
+
+# sum of i x r^i for i from 0 to m - 1, growth is PRICE_GROWTH as a float or a BigNum
+def _weighted_geometric_sum(m, growth=PRICE_GROWTH):
+    r = PRICE_GROWTH
+    return r * (1 - m * growth ** (m - 1) + (m - 1) * growth ** m) / (1 - r) ** 2
+
+# exact (unrounded) cost of the items owned..owned+count-1
+def _series_cost(base_cost, owned, count, step=0, growth=PRICE_GROWTH):
+    r = PRICE_GROWTH
+    total = base_cost * growth ** owned * (growth ** count - 1) / (r - 1)
+    if step:
+        total += step * (_weighted_geometric_sum(owned + count, growth) - _weighted_geometric_sum(owned, growth))
+    return total
+
+def unit_price(base_cost, owned, step=0):
+    """Returns the price of the next item when owned have already been bought."""
+    try:
+        return int((base_cost + step * owned) * PRICE_GROWTH ** owned)
+    except OverflowError:
+        return fit(math.floor((base_cost + step * owned) * _BIG_GROWTH ** owned))
+
+def bulk_price(base_cost, owned, count, step=0):
+    """Returns the total price of buying count more items in one transaction, in constant time."""
+    if count <= 0:
+        return 0
+    if count == 1:
+        return unit_price(base_cost, owned, step)
+    try:
+        return int(_series_cost(base_cost, owned, count, step))
+    except (OverflowError, ValueError): # inf, or inf - inf in the step term
+        return fit(math.floor(_series_cost(base_cost, owned, count, step, _BIG_GROWTH)))
+
+def max_affordable(cookies, base_cost, owned, step=0):
+    """Returns the largest count such that bulk_price(base_cost, owned, count, step) <= cookies."""
+    if cookies < unit_price(base_cost, owned, step):
+        return 0
+    r = PRICE_GROWTH
+    first = (base_cost + step * owned) * (_BIG_GROWTH ** owned if isinstance(cookies, BigNum) else r ** owned)
+    # solving first x (r^k - 1) / (r - 1) = cookies for k gives the exact answer without a step,
+    # and an upper bound with one since every later item costs at least as much as the geometric part
+    estimate = int(log(cookies * (r - 1) / first + 1) / math.log(r)) + 1
+    if not step:
+        count = estimate
+        while count > 1 and bulk_price(base_cost, owned, count) > cookies:
+            count -= 1 # corrects floating point error in the logarithm, runs at most a couple of times
+        while bulk_price(base_cost, owned, count + 1) <= cookies:
+            count += 1
+        return count
+    # the step term has no log solution, binary search between 1 and the bound using the closed form
+    low, high = 1, estimate
+    while low < high:
+        middle = (low + high + 1) // 2
+        if bulk_price(base_cost, owned, middle, step) <= cookies:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+# helpers for ShopItem / ShopUpgrade objects
+def item_price(item, count=1):
+    """Returns the price of buying count more of a shop item."""
+    return bulk_price(item.base_cost, item.purchased_count, count, item.cost_step)
+
+def item_max_affordable(item, cookies):
+    """Returns how many of a shop item the balance can buy in one transaction."""
+    return max_affordable(cookies, item.base_cost, item.purchased_count, item.cost_step)
@@ -0,0 +1,47 @@
+'''
+Module Name: rates.py
+Purpose: Cached cookies per second / cookies per click aggregates that only change when a purchase, prestige or event changes them
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import math
+
+from bignum import fit
+
+# set to True to check every cached read against a full recomputation (slow, for debugging only)
+DEBUG_RATES = False
+
+# Class for an aggregate that is kept up to date with deltas and only recomputed in full when marked dirty
+class RateCache:
+    def __init__(self, compute, name, debug=None):
+        self.compute = compute # function that recomputes the value from scratch
+        self.name = name # used in the debug assertion message
+        self.debug = DEBUG_RATES if debug is None else debug
+        self.cached = 0
+        self.dirty = True # forces a full recompute on the next read
+        self.recomputes = 0 # how many full recomputes were needed
+
+    @property
+    def value(self):
+        if self.dirty:
+            self.cached = self.compute()
+            self.dirty = False
+            self.recomputes += 1
+        elif self.debug:
+            expected = self.compute()
+            assert math.isclose(self.cached, expected, rel_tol=1e-9, abs_tol=1e-9), f"cached {self.name} {self.cached} != recomputed {expected}"
+        return self.cached
+
+    def add(self, delta):
+        """Applies a change to the aggregate without recomputing it."""
+        if not self.dirty:
+            self.cached = fit(self.cached + delta)
+
+    def invalidate(self):
+        """Marks the aggregate dirty, used when the state it depends on was replaced (load, new game, prestige)."""
+        self.dirty = True
@@ -0,0 +1,89 @@
+'''
+Module Name: renderer.py
+Purpose: Tracks which screen regions changed between frames so only those are pushed to the display
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import pygame
+
+# set to True to always push the whole screen with pygame.display.flip()
+FULL_REDRAW = False
+
+# Class for dirty rectangle rendering
+# Each frame the draw code marks the regions it drew with a key and a signature of what was drawn there.
+# A region is dirty when its key is new, gone, moved or its signature changed since the last frame.
+class DirtyRenderer:
+    def __init__(self, full_redraw=FULL_REDRAW):
+        self.full_redraw = full_redraw # switch to fall back to full screen updates
+        self.previous = {} # key -> (rect, signature) from the last presented frame
+        self.current = {} # key -> (rect, signature) marked during this frame
+        self.invalidated = True # something untracked was drawn this frame
+        self.previous_invalidated = False
+        self.dirty_rects = [] # rects pushed to the display last frame
+        self.dirty_pixels = 0 # number of pixels pushed to the display last frame
+
+    def mark(self, key, rect, signature=None):
+        """Records that rect was drawn this frame with content identified by signature."""
+        rect = pygame.Rect(rect)
+        if key in self.current:
+            old_rect, old_signature = self.current[key]
+            rect = rect.union(old_rect)
+            signature = (old_signature, signature)
+        self.current[key] = (rect, signature)
+
+    def invalidate(self):
+        """Forces a full screen update, used for menus, popups and resizes that are not tracked by region."""
+        self.invalidated = True
+
+    # collects the rects whose key, position or signature changed since the last frame
+    def _changed_rects(self):
+        rects = []
+        for key, (rect, signature) in self.current.items():
+            old = self.previous.get(key)
+            if old is None:
+                rects.append(rect)
+            elif old[0] != rect:
+                rects.append(rect)
+                rects.append(old[0])
+            elif old[1] != signature:
+                rects.append(rect)
+        for key, (rect, signature) in self.previous.items():
+            if key not in self.current:
+                rects.append(rect)
+        return rects
+
+    # merges overlapping rects so the pixel count is not inflated and fewer rects are uploaded
+    def _merge(self, rects, bounds):
+        merged = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self, screen):
+        """Pushes the changed regions of screen to the display and starts a new frame."""
+        bounds = screen.get_rect()
+        # the frame after an untracked one must also be full, since the display still shows the untracked content
+        if self.full_redraw or self.invalidated or self.previous_invalidated:
+            pygame.display.flip()
+            self.dirty_rects = [bounds]
+        else:
+            self.dirty_rects = self._merge(self._changed_rects(), bounds)
+            if self.dirty_rects:
+                pygame.display.update(self.dirty_rects)
+        self.dirty_pixels = sum(rect.width * rect.height for rect in self.dirty_rects)
+        self.previous_invalidated = self.invalidated
+        self.invalidated = False
+        self.previous = self.current
+        self.current = {}
@@ -0,0 +1,227 @@
+'''
+Module Name: save_format.py
+Purpose: Compact, versioned binary save format with typed fields and a migration chain that still reads the old text saves
+Inputs: None
+Output: None
+Additional code sources: https://docs.python.org/3/library/struct.html
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import struct
+import zlib
+
+from bignum import BigNum
+
+# File layout:
+#   header  = magic "CKSV", schema version (u16), reserved (u16), payload length (u32), payload crc32 (u32)
+#   payload = field count (u32) followed by that many fields
+#   field   = type (u8), name length (u8), name (utf-8), value length (u32), value
+# Every value carries its length, so a reader can skip field types it does not know about.
+MAGIC = b"CKSV"
+SCHEMA_VERSION = 2
+HEADER = struct.Struct("<4sHHII")
+
+TYPE_FLOAT = 1 # f64
+TYPE_INT = 2 # i64
+TYPE_STRING = 3 # utf-8
+TYPE_COUNTS = 4 # name -> i64 map
+TYPE_FLAGS = 5 # name -> bool map
+TYPE_BIGNUM = 6 # f64 mantissa, i64 binary exponent (see bignum.py)
+
+_FIELD = struct.Struct("<BB")
+_LENGTH = struct.Struct("<I")
+_FLOAT = struct.Struct("<d")
+_INT = struct.Struct("<q")
+_NAME = struct.Struct("<H")
+_BIGNUM = struct.Struct("<dq")
+
+# type of every field in the current schema
+FIELD_TYPES = {
+    "timestamp": TYPE_FLOAT,
+    "cookie_count": TYPE_BIGNUM,
+    "base_cookie_per_click": TYPE_BIGNUM,
+    "click_multiplier": TYPE_BIGNUM,
+    "purchases": TYPE_COUNTS, # shop items and upgrades
+    "prestige_count": TYPE_INT,
+    "golden_cookies": TYPE_BIGNUM,
+    "prestige_upgrades": TYPE_COUNTS,
+    "achievements": TYPE_FLAGS,
+    "total_click_cookies": TYPE_BIGNUM,
+    "clicks": TYPE_INT,
+}
+
+# Exception raised when a save file cannot be read
+class SaveFormatError(ValueError):
+    pass
+
+# default value for every field, used for fields missing from older saves
+def default_snapshot():
+    return {
+        "timestamp": 0.0,
+        "cookie_count": BigNum(0),
+        "base_cookie_per_click": BigNum(1),
+        "click_multiplier": BigNum(1),
+        "purchases": {},
+        "prestige_count": 0,
+        "golden_cookies": BigNum(0),
+        "prestige_upgrades": {},
+        "achievements": {},
+        "total_click_cookies": BigNum(0),
+        "clicks": 0,
+    }
+
+def _encode_map(values, as_flags):
+    parts = [_LENGTH.pack(len(values))]
+    for name, value in values.items():
+        encoded = name.encode("utf-8")
+        parts.append(_NAME.pack(len(encoded)))
+        parts.append(encoded)
+        parts.append(struct.pack("<?", bool(value)) if as_flags else _INT.pack(int(value)))
+    return b"".join(parts)
+
+def _encode_value(field_type, value):
+    if field_type == TYPE_FLOAT:
+        return _FLOAT.pack(float(value))
+    if field_type == TYPE_INT:
+        return _INT.pack(int(value))
+    if field_type == TYPE_STRING:
+        return str(value).encode("utf-8")
+    if field_type == TYPE_BIGNUM:
+        return _BIGNUM.pack(*BigNum(value).to_pair())
+    return _encode_map(value, field_type == TYPE_FLAGS)
+
+def encode(snapshot):
+    """Returns the bytes of a save file for a snapshot dict in the current schema."""
+    parts = []
+    for name, field_type in FIELD_TYPES.items():
+        if name not in snapshot:
+            continue
+        value = _encode_value(field_type, snapshot[name])
+        encoded_name = name.encode("utf-8")
+        parts.append(_FIELD.pack(field_type, len(encoded_name)))
+        parts.append(encoded_name)
+        parts.append(_LENGTH.pack(len(value)))
+        parts.append(value)
+    payload = _LENGTH.pack(len(parts) // 4) + b"".join(parts)
+    return HEADER.pack(MAGIC, SCHEMA_VERSION, 0, len(payload), zlib.crc32(payload)) + payload
+
+def _decode_map(data, as_flags):
+    (count,) = _LENGTH.unpack_from(data, 0)
+    offset = _LENGTH.size
+    values = {}
+    for _ in range(count):
+        (length,) = _NAME.unpack_from(data, offset)
+        offset += _NAME.size
+        name = bytes(data[offset:offset + length]).decode("utf-8")
+        offset += length
+        if as_flags:
+            (values[name],) = struct.unpack_from("<?", data, offset)
+            offset += 1
+        else:
+            (values[name],) = _INT.unpack_from(data, offset)
+            offset += _INT.size
+    return values
+
+def _decode_value(field_type, data):
+    if field_type == TYPE_FLOAT:
+        return _FLOAT.unpack(data)[0]
+    if field_type == TYPE_INT:
+        return _INT.unpack(data)[0]
+    if field_type == TYPE_STRING:
+        return bytes(data).decode("utf-8")
+    if field_type == TYPE_BIGNUM:
+        return BigNum.from_pair(_BIGNUM.unpack(data))
+    return _decode_map(data, field_type == TYPE_FLAGS)
+
+def _decode_binary(data):
+    if len(data) < HEADER.size:
+        raise SaveFormatError("save file is truncated")
+    magic, version, reserved, length, checksum = HEADER.unpack_from(data, 0)
+    payload = memoryview(data)[HEADER.size:HEADER.size + length]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise SaveFormatError("save file is truncated or corrupted")
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"save file version {version} is newer than this game ({SCHEMA_VERSION})")
+    (count,) = _LENGTH.unpack_from(payload, 0)
+    offset = _LENGTH.size
+    snapshot = {}
+    try:
+        for _ in range(count):
+            field_type, name_length = _FIELD.unpack_from(payload, offset)
+            offset += _FIELD.size
+            name = bytes(payload[offset:offset + name_length]).decode("utf-8")
+            offset += name_length
+            (value_length,) = _LENGTH.unpack_from(payload, offset)
+            offset += _LENGTH.size
+            value = payload[offset:offset + value_length]
+            offset += value_length
+            if field_type in (TYPE_FLOAT, TYPE_INT, TYPE_STRING, TYPE_COUNTS, TYPE_FLAGS, TYPE_BIGNUM):
+                snapshot[name] = _decode_value(field_type, value)
+    except (struct.error, UnicodeDecodeError) as error:
+        raise SaveFormatError(f"save file is corrupted: {error}")
+    return version, snapshot
+
+def parse_legacy(text):
+    """Parses the version 0 text save: timestamp, cookies, base CPC, click multiplier, then "name":count lines."""
+    lines = text.splitlines()
+    if len(lines) < 4:
+        raise SaveFormatError("legacy save file is truncated")
+    snapshot = {
+        "timestamp": float(lines[0].strip()),
+        "cookie_count": float(lines[1].strip()),
+        "base_cookie_per_click": float(lines[2].strip()),
+        "click_multiplier": float(lines[3].strip()),
+        "purchases": {},
+    }
+    for line in lines[4:]:
+        if not line.strip():
+            continue
+        item = line.split(':')
+        snapshot["purchases"][item[0].strip('"')] = int(item[1].strip())
+    return snapshot
+
+# version 0 (text) saves had no prestige, achievement or analytics state, they start from the defaults
+def _migrate_0_to_1(snapshot):
+    migrated = default_snapshot()
+    migrated.update(snapshot)
+    return migrated
+
+# version 1 stored the balance and multipliers as f64, version 2 stores them as BigNums so they can pass 1e308
+def _migrate_1_to_2(snapshot):
+    for name in ("cookie_count", "base_cookie_per_click", "click_multiplier", "golden_cookies", "total_click_cookies"):
+        if name in snapshot:
+            try:
+                snapshot[name] = BigNum(snapshot[name])
+            except ValueError as error: # an old save whose float overflowed to inf or nan
+                raise SaveFormatError(f"save has an unreadable {name}: {error}")
+    return snapshot
+
+# MIGRATIONS[n] upgrades a snapshot from schema n to n + 1, add an entry here whenever SCHEMA_VERSION goes up
+MIGRATIONS = {
+    0: _migrate_0_to_1,
+    1: _migrate_1_to_2,
+}
+
+def migrate(version, snapshot):
+    """Runs the migration chain from version up to SCHEMA_VERSION."""
+    while version < SCHEMA_VERSION:
+        snapshot = MIGRATIONS[version](snapshot)
+        version += 1
+    # fields added to the current schema after the file was written get their defaults
+    complete = default_snapshot()
+    complete.update(snapshot)
+    return complete
+
+def decode(data):
+    """Returns the snapshot dict stored in data, migrated to the current schema. Reads binary and legacy text saves."""
+    if data[:len(MAGIC)] == MAGIC:
+        version, snapshot = _decode_binary(data)
+    else:
+        try:
+            snapshot = parse_legacy(data.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError, IndexError) as error:
+            raise SaveFormatError(f"unrecognized save file: {error}")
+        version = 0
+    return migrate(version, snapshot)
@@ -11,13 +11,41 @@ Last Modified: 10/26/2024
 
 import time
 
-# saves the current game to the save file (currently hardcoded to save.txt)
+from save_format import encode
+from save_writer import save_writer
+from save_slots import slot_manager
+
+# collects everything a save file stores into a snapshot dict (see save_format.FIELD_TYPES)
+def snapshot(ui_manager):
+    purchases = {item.name: item.purchased_count for item in ui_manager.shop_items.values()}
+    purchases.update((upgrade.name, upgrade.purchased_count) for upgrade in ui_manager.shop_upgrades.values())
+    state = {
+        "timestamp": time.time(),
+        "cookie_count": ui_manager.cookie_count,
+        "base_cookie_per_click": ui_manager.base_cookie_per_click,
+        "click_multiplier": ui_manager.click_multiplier,
+        "purchases": purchases,
+    }
+    prestige = getattr(ui_manager, "prestige", None)
+    if prestige is not None:
+        state["prestige_count"] = prestige.prestige_count
+        state["golden_cookies"] = prestige.golden_cookies
+        state["prestige_upgrades"] = {key: item.purchased_count for key, item in prestige.get_shop_items()}
+    achievement_manager = getattr(ui_manager, "achievement_manager", None)
+    if achievement_manager is not None:
+        state["achievements"] = achievement_manager.state()
+    analytics = getattr(ui_manager, "analytics", None)
+    if analytics is not None:
+        state["total_click_cookies"] = analytics.total_cookies
+        state["clicks"] = analytics.clicks
+    return state
+
+# saves the current game to the given save file in the binary format from save_format.py
+# the state is serialized here, the disk write happens on the save writer thread
 def save(ui_manager, save_name):
-    with open(save_name, 'w') as file:
-        # saves the user's current balance along with any shop purchases they have made
-        output = f'{time.time()}\n{ui_manager.cookie_count}\n{ui_manager.base_cookie_per_click}\n{ui_manager.click_multiplier}\n'
-        for item in ui_manager.shop_items.values():
-            output += f'"{item.name}":{item.purchased_count}\n'
-        for upgrade in ui_manager.shop_upgrades.values():
-            output += f'"{upgrade.name}":{upgrade.purchased_count}\n'
-        file.write(output)
+    save_writer.submit_snapshot(save_name, encode(snapshot(ui_manager)))
+    slot_manager.record(save_name, ui_manager)
+
+# records a shop purchase in the save's journal so it survives a crash before the next full save
+def journal_purchase(save_name, item, quantity, cookie_count):
+    save_writer.submit_purchase(save_name, item.name, quantity, cookie_count)
@@ -0,0 +1,124 @@
+'''
+Module Name: save_slots.py
+Purpose: Any number of save slots, with a small index file caching each slot's summary for the save menus
+Inputs: None
+Output: save_slots.json, the slot index
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import glob
+import json
+import os
+import re
+import time
+
+from bignum import BigNum
+from save_format import decode, SaveFormatError
+from save_writer import save_writer, write_atomic
+from shop import shop_items, shop_upgrades
+
+SLOT_INDEX = "save_slots.json"
+MIN_SLOTS = 3 # empty slots shown even before anything was saved
+# slots keep the old save1.txt names so existing saves still show up, the files themselves are binary now
+SLOT_PATTERN = re.compile(r"save(\d+)\.txt$")
+
+# index values are [mantissa, exponent] pairs (tuples until the index is read back from JSON), plain numbers are accepted too
+def _number(value):
+    return BigNum.from_pair(value) if isinstance(value, (list, tuple)) else BigNum(value)
+
+# Class that knows which slots exist and what is in them without opening the saves
+class SaveSlotManager:
+    def __init__(self, directory=".", index_name=SLOT_INDEX, min_slots=MIN_SLOTS):
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_name)
+        self.min_slots = min_slots
+        self.index = self._read_index() # file name -> {"last_played", "cookies", "cps", "prestige_count"}
+        self.scanned = False # saves from before the index are looked for when a save menu first asks
+
+    # saves written before the index existed are summarized once, then cached in the index
+    # this waits for the first menu so the game's modules (prestige, autosave) are all loaded by then
+    def _scan(self):
+        if self.scanned:
+            return
+        self.scanned = True
+        for path in glob.glob(os.path.join(self.directory, "save*.txt")):
+            name = os.path.basename(path)
+            if SLOT_PATTERN.match(name) and name not in self.index:
+                self._summarize_file(name)
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r') as file:
+                return json.load(file).get("slots", {})
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_index(self):
+        data = json.dumps({"slots": self.index}, indent=1).encode("utf-8")
+        save_writer.submit_call(lambda: write_atomic(self.index_path, data, backups=0))
+
+    def _summarize_file(self, name):
+        try:
+            with open(os.path.join(self.directory, name), 'rb') as file:
+                state = decode(file.read())
+        except (OSError, SaveFormatError):
+            return
+        # the CPS comes from the same Economy rates record() reads, so prestige upgrades and multipliers count the same way
+        from economy import Economy
+        from load_game import apply_snapshot
+        from prestige import Prestige
+        economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades), Prestige())
+        apply_snapshot(economy, state)
+        cps = economy.cookies_per_second()
+        self.index[name] = {"last_played": state["timestamp"], "cookies": state["cookie_count"].to_pair(),
+                            "cps": BigNum(cps).to_pair(), "prestige_count": state["prestige_count"]}
+        self._write_index()
+
+    def slot_path(self, number):
+        """Returns the save file of a slot."""
+        return os.path.join(self.directory, f"save{number}.txt")
+
+    def slot_numbers(self):
+        """Returns every slot number with a save, plus the first min_slots, in order."""
+        self._scan()
+        numbers = set(range(1, self.min_slots + 1))
+        for name in self.index:
+            match = SLOT_PATTERN.match(name)
+            if match:
+                numbers.add(int(match.group(1)))
+        return sorted(numbers)
+
+    def next_free_slot(self):
+        """Returns the lowest slot number without a save."""
+        used = {number for number in self.slot_numbers() if self.summary(number) is not None}
+        number = 1
+        while number in used:
+            number += 1
+        return number
+
+    def summary(self, number):
+        """Returns the cached summary of a slot, None if it is empty."""
+        self._scan()
+        summary = self.index.get(os.path.basename(self.slot_path(number)))
+        if summary is None:
+            return None
+        return dict(summary, cookies=_number(summary["cookies"]), cps=_number(summary["cps"]))
+
+    def record(self, save_name, ui_manager):
+        """Updates a slot's summary after a save, the index is written on the save writer thread."""
+        if not SLOT_PATTERN.match(os.path.basename(save_name)):
+            return
+        prestige = getattr(ui_manager, "prestige", None)
+        self.index[os.path.basename(save_name)] = {
+            "last_played": time.time(),
+            "cookies": BigNum(ui_manager.cookie_count).to_pair(), # BigNums are stored as [mantissa, exponent]
+            "cps": BigNum(ui_manager.cookies_per_second()).to_pair(),
+            "prestige_count": prestige.prestige_count if prestige is not None else 0,
+        }
+        self._write_index()
+
+slot_manager = SaveSlotManager()
@@ -0,0 +1,164 @@
+'''
+Module Name: save_writer.py
+Purpose: Crash safe save pipeline, atomic snapshot writes with rotating backups and a purchase journal, run on a background thread
+Inputs: Save file bytes from save_game.py
+Output: Save files, their backups (save.1, save.2, ...) and journals (save.journal)
+Additional code sources: https://docs.python.org/3/library/os.html#os.replace
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import os
+import queue
+import shutil
+import struct
+import threading
+import time
+import zlib
+
+from bignum import BigNum
+
+BACKUPS = 3 # how many older snapshots are kept next to each save file
+
+# journal record = crc32 (u32), payload length (u16), payload
+# payload = time (f64), quantity (i64), cookie count after the purchase (BigNum mantissa f64, exponent i64), item name (utf-8)
+_RECORD = struct.Struct("<IH")
+_PURCHASE = struct.Struct("<dqdq")
+
+def backup_path(path, number):
+    return f"{path}.{number}"
+
+def journal_path(path):
+    return f"{path}.journal"
+
+# makes a rename durable by syncing the directory entry, not supported on every platform
+def _fsync_directory(path):
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+# puts a second name on the current save (a copy where hard links are not supported), the save itself stays where it is
+def _link_or_copy(path, target):
+    temp = f"{target}.tmp"
+    if os.path.exists(temp):
+        os.remove(temp)
+    try:
+        os.link(path, temp)
+    except OSError:
+        shutil.copy2(path, temp)
+    os.replace(temp, target)
+
+def write_atomic(path, data, backups=BACKUPS):
+    """Writes data to a temp file, fsyncs it and renames it over path, keeping the old file as the newest backup."""
+    temp = f"{path}.tmp"
+    with open(temp, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    if backups and os.path.exists(path):
+        for number in range(backups - 1, 0, -1):
+            if os.path.exists(backup_path(path, number)):
+                os.replace(backup_path(path, number), backup_path(path, number + 1))
+        # path is never missing, a crash here still loads it with its journal rather than falling back to a backup
+        _link_or_copy(path, backup_path(path, 1))
+    os.replace(temp, path)
+    _fsync_directory(path)
+
+def encode_purchase(name, quantity, cookie_count, timestamp=None):
+    """Returns one journal record for a purchase."""
+    payload = _PURCHASE.pack(time.time() if timestamp is None else timestamp, quantity, *BigNum(cookie_count).to_pair()) + name.encode("utf-8")
+    return _RECORD.pack(zlib.crc32(payload), len(payload)) + payload
+
+def read_journal(path):
+    """Returns the (time, name, quantity, cookie count after) records in a save's journal, stopping at the first torn or corrupt record."""
+    try:
+        with open(journal_path(path), 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return []
+    records = []
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        checksum, length = _RECORD.unpack_from(data, offset)
+        payload = data[offset + _RECORD.size:offset + _RECORD.size + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            break # the game died partway through this append, everything before it is good
+        timestamp, quantity, mantissa, exponent = _PURCHASE.unpack_from(payload, 0)
+        records.append((timestamp, payload[_PURCHASE.size:].decode("utf-8"), quantity, BigNum.from_pair((mantissa, exponent))))
+        offset += _RECORD.size + length
+    return records
+
+# Class that owns the writer thread, tasks run in the order they were submitted
+# so journal appends always land after the snapshot they follow
+class SaveWriter:
+    def __init__(self, backups=BACKUPS):
+        self.backups = backups
+        self.tasks = queue.Queue()
+        self.thread = None
+        self.last_error = None # last exception raised while writing, the game keeps running
+        self.snapshots_written = 0
+        self.journal_records = 0
+
+    # the thread is started on the first save so importing this module stays free
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        while True:
+            kind, path, data = self.tasks.get()
+            try:
+                if kind == "snapshot":
+                    self.write_snapshot(path, data)
+                elif kind == "call":
+                    data() # a job that does its own serialization on this thread (see autosave.py)
+                else:
+                    with open(journal_path(path), 'ab') as file:
+                        file.write(data)
+                        file.flush()
+                        os.fsync(file.fileno())
+                    self.journal_records += 1
+            except Exception as error: # one failed job must not stop the thread, or every later save would be dropped
+                self.last_error = error
+                print(f"Error writing save file: {error!r}")
+            finally:
+                self.tasks.task_done()
+
+    def write_snapshot(self, path, data):
+        """Writes a full save and empties its journal, only call this on the writer thread."""
+        write_atomic(path, data, self.backups)
+        # the snapshot now includes every journaled purchase, if the game dies before this the load skips them by timestamp
+        self.empty_journal(path)
+        self.snapshots_written += 1
+
+    def empty_journal(self, path):
+        with open(journal_path(path), 'wb'):
+            pass
+
+    def submit_snapshot(self, path, data):
+        """Queues a full save, data is the already serialized save file."""
+        self.tasks.put(("snapshot", os.fspath(path), data))
+        self._start()
+
+    def submit_purchase(self, path, name, quantity, cookie_count):
+        """Queues a purchase for the save's journal."""
+        self.tasks.put(("journal", os.fspath(path), encode_purchase(name, quantity, cookie_count)))
+        self._start()
+
+    def submit_call(self, job):
+        """Queues a function to run on the writer thread, in order with the other writes."""
+        self.tasks.put(("call", None, job))
+        self._start()
+
+    def flush(self):
+        """Blocks until every queued write is on disk, used before loading and on quit."""
+        if self.thread is not None and self.thread.is_alive():
+            self.tasks.join()
+
+save_writer = SaveWriter()
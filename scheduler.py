@@ -0,0 +1,79 @@
+'''
+Module Name: scheduler.py
+Purpose: Timer queue for game events, kept in a heap so a frame only does work when a timer is due
+Inputs: None
+Output: None
+Additional code sources: https://docs.python.org/3/library/heapq.html#priority-queue-implementation-notes
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import heapq
+import itertools
+import time
+
+# Class for one scheduled call, returned by the scheduler so it can be cancelled
+class Timer:
+    __slots__ = ("due", "callback", "args", "cancelled")
+
+    def __init__(self, due, callback, args):
+        self.due = due # time the callback runs at, same clock as the scheduler, passed to the callback as its first argument
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Stops the timer from running, it is dropped when it reaches the front of the heap."""
+        self.cancelled = True
+
+# Class for a min-heap of timers ordered by due time, timers due at the same time run in the order they were added
+class Scheduler:
+    def __init__(self, clock=time.time):
+        self.clock = clock # the game passes its own frame time to run_due, the clock is only the default
+        self.heap = [] # (due, sequence number, Timer)
+        self.counter = itertools.count()
+        self.timers_run = 0
+
+    def call_at(self, due, callback, *args):
+        """Runs callback(due, *args) at time due, returns the Timer."""
+        timer = Timer(due, callback, args)
+        heapq.heappush(self.heap, (due, next(self.counter), timer))
+        return timer
+
+    def call_later(self, delay, callback, *args, now=None):
+        """Runs callback(due, *args) delay seconds from now, returns the Timer."""
+        return self.call_at((self.clock() if now is None else now) + delay, callback, *args)
+
+    def next_due(self):
+        """Returns when the next live timer is due, None if nothing is scheduled."""
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def run_due(self, now=None):
+        """Runs every timer due at or before now, returns how many ran. Costs one comparison when nothing is due."""
+        heap = self.heap
+        if not heap:
+            return 0
+        if now is None:
+            now = self.clock()
+        if heap[0][0] > now:
+            return 0
+        ran = 0
+        # callbacks may schedule new timers, those also run now if they are already due
+        # a recurring timer should reschedule from the due time it was given, not the clock, so catching up always ends
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if timer.cancelled:
+                continue
+            timer.callback(timer.due, *timer.args)
+            ran += 1
+        self.timers_run += ran
+        return ran
+
+    def clear(self):
+        self.heap.clear()
+
+    def __len__(self):
+        return sum(1 for _, _, timer in self.heap if not timer.cancelled)
@@ -9,44 +9,128 @@ Date: 10/26/2024
 Last Modified: 11/10/2024
 '''
 
+import json
+import os
+
+from bignum import BigNum, fit
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "shop.json")
+
+# Exception raised at startup when the shop catalog has a mistake in it
+class CatalogError(ValueError):
+    pass
+
+# effect descriptors, each is built once from the catalog and applied to the economy on every purchase
+
+# Class for an effect that adds cookies per second for each one bought
+class AddCps:
+    def __init__(self, amount):
+        self.amount = amount
+
+    def apply(self, economy, quantity):
+        economy.cps_cache.add(self.amount * quantity) # only this item's contribution changed
+
+# Class for an effect that adds to the base cookies per click for each one bought
+class AddCpc:
+    def __init__(self, amount):
+        self.amount = amount
+
+    def apply(self, economy, quantity):
+        economy.base_cookie_per_click = fit(economy.base_cookie_per_click + self.amount * quantity)
+
+# Class for an effect that multiplies cookies per click by factor for each one bought
+class MultiplyCpc:
+    def __init__(self, factor):
+        self.factor = factor
+
+    def apply(self, economy, quantity):
+        economy.click_multiplier = fit(BigNum(economy.click_multiplier) * BigNum(self.factor) ** quantity)
+
+# effect type in the catalog -> (descriptor class, name of its number field)
+EFFECT_TYPES = {
+    "add_cps": (AddCps, "amount"),
+    "add_cpc": (AddCpc, "amount"),
+    "multiply_cpc": (MultiplyCpc, "factor"),
+}
+
+# builds the effects of an item that was created in code instead of the catalog (e.g. the prestige upgrades)
+def _effects_from_rates(cps, cpc):
+    effects = []
+    if cps is not None:
+        effects.append(AddCps(cps))
+    if cpc is not None:
+        effects.append(AddCpc(cpc))
+    return tuple(effects)
+
 # Class for Shop Items
 class ShopItem:
-    def __init__(self, name, base_cost, cps, cpc, image=None):
+    def __init__(self, name, base_cost, cps, cpc, image=None, cost_step=0, effects=None):
         self.name = name # Item Name
         self.base_cost = base_cost # Starting cost 
+        self.cost_step = cost_step # Added to the base cost for every purchase (see pricing.py)
         self.cost = base_cost # Cost to purchase
         self.cps = cps # Cookies per second
         self.cpc = cpc # Cookies per click (multiple)
         self.purchased_count = 0  # Track how many times this item has been purchased
         self.image = image
+        self.effects = _effects_from_rates(cps, cpc) if effects is None else tuple(effects) # applied by Economy.apply_purchase
 
 # Class for shop upgrades, which are one-time purchases
-class ShopUpgrade:
-    def __init__(self, name, base_cost, cps, cpc, image=None):
-        self.name = name # Item Name
-        self.base_cost = base_cost # Starting cost 
-        self.cost = base_cost # Cost to purchase
-        self.cps = cps # Cookies per second
-        self.cpc = cpc # Cookies per click (multiple)
-        self.purchased_count = 0  # Track how many times this item has been purchased
-        self.image = image
+class ShopUpgrade(ShopItem):
+    pass
 
-# price = base x 1.15 ^ (buildings owned)
-shop_items = {
-    'Extra Hands': ShopItem("Extra Hands", 10, None, .1, 'assets/in_game_buttons/extra_hands_button_rectangle.png'), # Made upgrade more reasonable
-    'Cursor': ShopItem("Cursor", 50, .5, None, 'assets/in_game_buttons/cursor_button_rectangle.png'),
-    'Grandma': ShopItem("Grandma", 100, 1, None, 'assets/in_game_buttons/grandma_button_rectangle.png'),
-    'Farm': ShopItem("Farm", 500, 5, None, 'assets/in_game_buttons/farm_button_rectangle.png'),
-    'Factory': ShopItem("Factory", 1000, 10, None, 'assets/in_game_buttons/factory_button_rectangle.png')
-}
+def _number(entry, field, where, minimum=0, default=None):
+    value = entry.get(field, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        raise CatalogError(f"{where}: {field} must be a number of at least {minimum}, got {value!r}")
+    return value
 
+def _compile_effect(effect, where):
+    if not isinstance(effect, dict) or effect.get("type") not in EFFECT_TYPES:
+        raise CatalogError(f"{where}: unknown effect {effect!r}, expected one of {sorted(EFFECT_TYPES)}")
+    effect_class, field = EFFECT_TYPES[effect["type"]]
+    return effect_class(_number(effect, field, where, minimum=0))
 
-# These upgraeds can be renamed to whatever is necesarry to match the shop items, we can also change the cps and cpc values to whatever we want
-shop_upgrades = {
-    'Click Multiplier 1': ShopUpgrade("Click Multiplier 1", 1000, None, 1.05, 'assets/in_game_buttons/click_multipier_1_rectangle.png'),  # Can rename this to rolling pin 1
-    'Click Multiplier 2': ShopUpgrade("Click Multiplier 2", 100000, None, 1.15, 'assets/in_game_buttons/click_multiplier_2_rectangle.png'),  # Can rename this to rolling pin 2
-    'Click Multiplier 3': ShopUpgrade("Click Multiplier 3", 1000000, None, 1.35, 'assets/in_game_buttons/click_multiplier_3_rectangle.png'),  # Can rename this to rolling pin 3
-    'Increase Click 1': ShopUpgrade("Increase Click 1", 3, None, 2, 'assets/in_game_buttons/increase_click_1_rectangle.png'),  # Can rename this to Reinforced Hands
-    'Increase Click 2': ShopUpgrade("Increase Click 2", 6, None, 3, 'assets/in_game_buttons/increase_click_2_rectangle.png'),  # Can rename this to Strengthened Hands
-    'Increase Click 3': ShopUpgrade("Increase Click 3", 12, None, 5, 'assets/in_game_buttons/increase_click_3_rectangle.png')  # Can rename this to Sturdy Hands
-}
+def _compile_entry(entry, item_class, where, root):
+    if not isinstance(entry, dict) or not isinstance(entry.get("name"), str) or not entry["name"]:
+        raise CatalogError(f"{where}: every entry needs a name")
+    where = f"{where} {entry['name']!r}"
+    effects = entry.get("effect")
+    effects = [effects] if isinstance(effects, dict) else effects
+    if not effects:
+        raise CatalogError(f"{where}: needs at least one effect")
+    effects = tuple(_compile_effect(effect, where) for effect in effects)
+    image = entry.get("image")
+    if image is not None and not os.path.exists(os.path.join(root, image)):
+        raise CatalogError(f"{where}: image {image!r} does not exist")
+    # cps and cpc are kept for the code that shows or sums them (shop text, analytics, batch_economy.py)
+    cps = sum(effect.amount for effect in effects if isinstance(effect, AddCps)) or None
+    cpc = next((getattr(effect, "amount", getattr(effect, "factor", None)) for effect in effects
+                if not isinstance(effect, AddCps)), None)
+    return item_class(entry["name"], _number(entry, "base_cost", where, minimum=1), cps, cpc, image,
+                      _number(entry, "cost_step", where, default=0), effects)
+
+def load_catalog(path=CATALOG_FILE):
+    """Reads and checks the shop catalog, returns (shop_items, shop_upgrades) as name -> item dicts in file order."""
+    try:
+        with open(path, 'r') as file:
+            data = json.load(file)
+    except (OSError, ValueError) as error:
+        raise CatalogError(f"could not read the shop catalog {path}: {error}")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(path))) # image paths are relative to the game folder
+    catalog = []
+    names = set()
+    for section, item_class in (("items", ShopItem), ("upgrades", ShopUpgrade)):
+        entries = {}
+        for index, entry in enumerate(data.get(section, [])):
+            item = _compile_entry(entry, item_class, f"{path} {section}[{index}]", root)
+            if item.name in names:
+                raise CatalogError(f"{path}: {item.name!r} is listed more than once")
+            names.add(item.name)
+            entries[item.name] = item
+        catalog.append(entries)
+    return tuple(catalog)
+
+# price = (base + cost_step x owned) x 1.15 ^ (owned), see pricing.py
+# loaded when the game starts, so a broken catalog stops the game right away instead of on the first purchase
+shop_items, shop_upgrades = load_catalog()
@@ -0,0 +1,172 @@
+'''
+Module Name: simulator.py
+Purpose: Headless fast-forward of the cookie economy for balancing the shop costs, no pygame window needed
+         Runs the game's own Economy, prestige upgrades, Scheduler and RandomEventManager (seeded), so event modifiers and
+         gambling shape the run as they do in play. Prestiging itself (resetting the balance for golden cookies) is a player
+         decision and is not simulated, a run keeps the prestige level it started with.
+Inputs: Optional save file to start from
+Output: Time series of cookies, cookies per second and purchases
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import sys
+import time
+
+from bignum import BigNum, fit, isfinite
+from economy import Economy
+from events import RandomEventManager
+from prestige import Prestige
+from pricing import item_price
+from scheduler import Scheduler
+from shop import shop_items, shop_upgrades
+
+# Class for the output of a simulator run
+class SimulationResult:
+    def __init__(self):
+        self.times = [] # seconds since the start of the run
+        self.cookies = [] # balance at each time
+        self.cps = [] # cookies per second at each time
+        self.purchases = [] # (time, item name, quantity, price)
+        self.events = 0 # random events started, gambles included
+
+    def record(self, seconds, cookies, cps):
+        self.times.append(seconds)
+        self.cookies.append(cookies)
+        self.cps.append(cps)
+
+# purchase policies, each takes the economy and returns (item, quantity) to buy next or None to stop buying
+
+def cheapest_policy(economy):
+    """Always buys the cheapest item in the shop."""
+    items = list(economy.shop_items.values()) + list(economy.shop_upgrades.values())
+    return min(items, key=item_price), 1
+
+def best_payback_policy(economy):
+    """Buys the building with the lowest price per extra cookie per second."""
+    buildings = [item for item in economy.shop_items.values() if item.cps]
+    if not buildings:
+        return None
+    return min(buildings, key=lambda item: item_price(item) / item.cps), 1
+
+def scripted_policy(build_order):
+    """Returns a policy that buys the names in build_order one after another, then stops."""
+    remaining = list(build_order)
+    def policy(economy):
+        if not remaining:
+            return None
+        name = remaining.pop(0)
+        item = economy.shop_items.get(name) or economy.shop_upgrades[name]
+        return item, 1
+    return policy
+
+# Class that fast-forwards an Economy by jumping straight from one purchase or event timer to the next
+class Simulator:
+    def __init__(self, economy=None, clicks_per_second=0, events=True, seed=None, gamble=False):
+        if economy is None:
+            # copies of the catalog so runs do not change the game's shop, prestige upgrades add to CPS as in the game
+            economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades), Prestige())
+        self.economy = economy
+        self.clicks_per_second = clicks_per_second # simulated clicks on the big cookie, 0 for idle play
+        self.gamble = gamble # answer to every gambling event, True risks the balance
+        self.now = 0.0 # simulated seconds since the first run started, the scheduler's clock, carried on by later runs
+        self.scheduler = Scheduler(clock=lambda: self.now)
+        # the game's event timers and modifiers, seeded so a run can be repeated, None to leave events out
+        self.event_manager = RandomEventManager(self.scheduler, lambda: self.economy, seed=seed, verbose=False) if events else None
+
+    @classmethod
+    def from_save(cls, save_name, clicks_per_second=0, events=True, seed=None, gamble=False):
+        """Starts from a save file instead of a new game."""
+        from load_game import load
+        simulator = cls(clicks_per_second=clicks_per_second, events=events, seed=seed, gamble=gamble)
+        load(simulator.economy, save_name)
+        return simulator
+
+    # runs the event timers due at the current time, a gamble is answered straight away
+    def run_events(self):
+        self.scheduler.run_due(self.now)
+        if self.event_manager.show_gambling_popup:
+            self.event_manager.resolve_gambling_event(self.economy, self.gamble)
+
+    # cookies earned per second from production and simulated clicking
+    def income(self):
+        return self.economy.cookies_per_second() + self.economy.cookie_per_click * self.clicks_per_second
+
+    def run(self, hours, policy, sample_interval=60, max_purchases=10000):
+        """
+        Simulates hours of play buying whatever policy picks. Between purchases and event timers the income is constant,
+        so the simulator jumps to the moment the next purchase is affordable or the next event starts or ends instead of ticking.
+        Returns a SimulationResult sampled every sample_interval seconds and at every purchase.
+        Stops after max_purchases, once income outgrows prices the purchases stop taking any time.
+        """
+        result = SimulationResult()
+        economy = self.economy
+        end = hours * 3600
+        now = 0.0
+        origin = self.now # the result's times start at 0, the scheduler's carry on from the last run
+        if self.event_manager is not None and self.event_manager.next_timer is None:
+            self.event_manager.start(self.now)
+        events_before = self.event_manager.started if self.event_manager is not None else 0
+        next_sample = sample_interval
+        result.record(now, economy.cookie_count, economy.cookies_per_second())
+        choice = policy(economy)
+        while now < end:
+            income = self.income()
+            if not isfinite(income):
+                break # an income this large would have been a BigNum, something overflowed on the way
+            if choice is not None:
+                item, quantity = choice
+                price = item_price(item, quantity)
+                if economy.cookie_count >= price:
+                    if len(result.purchases) >= max_purchases:
+                        break
+                    economy.apply_purchase(item, quantity)
+                    result.purchases.append((now, item.name, quantity, price))
+                    result.record(now, economy.cookie_count, economy.cookies_per_second())
+                    choice = policy(economy)
+                    continue
+                if income <= 0:
+                    choice = None # nothing will ever be affordable, just let time pass
+            # jump to the next purchase, or the end of the run if there is none
+            if choice is not None:
+                target = min(end, now + float((price - economy.cookie_count) / income)) # seconds always fit in a float
+            else:
+                target = end
+            purchase_time = target
+            due = self.scheduler.next_due()
+            if due is not None and due - origin < target:
+                target = max(now, due - origin) # the income changes when an event starts or ends
+            # samples between now and target lie on a straight line, so they are computed directly
+            start_cookies = economy.cookie_count
+            while sample_interval and next_sample < target:
+                result.record(next_sample, start_cookies + income * (next_sample - now), economy.cookies_per_second())
+                next_sample += sample_interval
+            economy.cookie_count = fit(start_cookies + BigNum(income) * (target - now))
+            now = target
+            self.now = origin + now
+            if target < purchase_time:
+                self.run_events()
+                continue
+            # guards against floating point leaving the balance a hair under the price
+            if choice is not None and now < end and economy.cookie_count < price:
+                economy.cookie_count = fit(price)
+        result.record(now, economy.cookie_count, economy.cookies_per_second())
+        if self.event_manager is not None:
+            result.events = self.event_manager.started - events_before
+        return result
+
+# runs each policy for a few hours and prints a summary, used when tuning the costs in shop.py
+def main():
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    for name, policy in [("cheapest", cheapest_policy), ("best payback", best_payback_policy)]:
+        simulator = Simulator(clicks_per_second=1, seed=0)
+        start = time.perf_counter()
+        result = simulator.run(hours, policy)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {len(result.purchases)} purchases, {result.events} events, {result.cookies[-1]:.0f} cookies, {result.cps[-1]:.1f} CPS after {result.times[-1] / 3600:.2f} hours ({elapsed * 1000:.1f} ms)")
+
+if __name__ == '__main__':
+    main()
@@ -8,33 +8,110 @@ Developers: Ian Wilson, Andrew Uriell, Peter Pham, Michael Oliver, Jack Youngqui
 Date: 11/3/2024
 Last Modified: 11/8/2024
 '''
+import time
+
 import pygame
 
+from assets import asset_key
+from loader import asset_loader
+from music import MusicPlayer
+
 # Global variable to control the sound state (True = sound on, False = sound off)
 sound_enabled = True
 
+# mixer channels reserved for each category, a category can never take another one's channels
+SOUND_CATEGORIES = {"click": 4, "ui": 2, "shop": 2, "music": 2}
+# name -> (file, category, seconds that must pass before the same sound starts again)
+SOUND_EFFECTS = {
+    'click': ("click.mp3", "click", 0.05),
+    'shop': ("shop2.mp3", "shop", 0.05),
+    'menu-click': ("menu-click2.mp3", "ui", 0.1),
+}
+MUSIC_PLAYLIST = ["smooth-coffee.mp3"] # background music, played in order and crossfaded
+
+# Class for the channels reserved for one category of sounds
+# when they are all busy the voice that started first is stopped to make room (voice stealing)
+class ChannelPool:
+    def __init__(self, channels):
+        self.channels = channels
+        self.started = [0.0] * len(channels) # when each channel's current voice started
+
+    def play(self, sound, now):
+        """Plays sound on an idle channel, or steals the oldest voice. Returns True if a voice was stolen."""
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                break
+        else:
+            index = min(range(len(self.channels)), key=self.started.__getitem__)
+        stolen = self.channels[index].get_busy()
+        self.channels[index].play(sound) # playing on a busy channel stops its current voice
+        self.started[index] = now
+        return stolen
+
+# one SoundManager is shared by the UIManager and the Game, see sound_manager below
 class SoundManager:
-    def __init__(self, assets_path='./assets/sounds'):
-        # Initialize the mixer module for handling sounds
-        pygame.mixer.init()
+    def __init__(self, assets_path='./assets/sounds', clock=time.monotonic):
         self.toggle_music = False
         self.music_playing = True
-        self.sounds = {
-            'click': pygame.mixer.Sound(f"{assets_path}/click.mp3"),
-            'shop': pygame.mixer.Sound(f"{assets_path}/shop2.mp3"),
-            'menu-click': pygame.mixer.Sound(f"{assets_path}/menu-click2.mp3"),
-        }
-    
+        self.sound_files = {name: f"{assets_path}/{file}" for name, (file, _, _) in SOUND_EFFECTS.items()}
+        self.sounds = {} # name -> decoded Sound, filled in as the loader finishes them
+        self.pools = {} # category -> ChannelPool, set up once the mixer is running
+        self.clock = clock
+        self.last_played = {} # name -> when it last started, for the rate limit
+        # voices played and dropped, a click is a few dictionary lookups however often it happens
+        self.counters = {"played": 0, "stolen": 0, "rate_limited": 0, "muted": 0, "loading": 0, "unknown": 0}
+        self.music = MusicPlayer([f"{assets_path}/{file}" for file in MUSIC_PLAYLIST], asset_loader)
+
+    def load(self, loader=asset_loader):
+        """Starts the mixer and decodes the sound effects on the loader's threads, or right away if loader is None."""
+        # Initialize the mixer module for handling sounds
+        pygame.mixer.init()
+        if not self.pools:
+            self.reserve_channels()
+        for name, path in self.sound_files.items():
+            if name in self.sounds:
+                continue
+            if loader is None:
+                self.sounds[name] = pygame.mixer.Sound(path)
+            else:
+                loader.sound(asset_key(path), path, lambda sound, name=name: self.sounds.__setitem__(name, sound))
+
+    # gives each category its own channels, reserved so pygame never hands them to an unmanaged Sound.play
+    def reserve_channels(self):
+        total = sum(SOUND_CATEGORIES.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for category, count in SOUND_CATEGORIES.items():
+            self.pools[category] = ChannelPool([pygame.mixer.Channel(first + i) for i in range(count)])
+            first += count
+        self.music.attach(self.pools["music"].channels)
+
     def play_sound(self, sound_name):
-        """Plays the sound effect if it exists in the sounds dictionary and sound is enabled."""
-        global sound_enabled  # Use the global variable to check sound state
-        if sound_enabled and sound_name in self.sounds:
-            self.sounds[sound_name].play()
-        elif not sound_enabled:
-            print("Sound is disabled. No sound will play.")
-        else:
-            print(f"Sound '{sound_name}' not found in sounds dictionary.")
-    
+        """Plays the sound effect on its category's channels, drops it silently when muted, still loading or rate limited."""
+        if not sound_enabled:
+            self.counters["muted"] += 1
+            return
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            # still decoding, the first clicks after startup are silent rather than waiting for it
+            self.counters["loading" if sound_name in self.sound_files else "unknown"] += 1
+            return
+        now = self.clock()
+        _, category, min_interval = SOUND_EFFECTS[sound_name]
+        if now - self.last_played.get(sound_name, -min_interval) < min_interval:
+            self.counters["rate_limited"] += 1
+            return
+        self.last_played[sound_name] = now
+        if self.pools[category].play(sound, now):
+            self.counters["stolen"] += 1
+        self.counters["played"] += 1
+
+    def stats(self):
+        """Returns the played and dropped voice counters."""
+        return dict(self.counters, dropped=self.counters["rate_limited"] + self.counters["muted"]
+                    + self.counters["loading"] + self.counters["unknown"])
+
     def toggle_sound(self):
         """Toggles the global sound state and manages background music playback."""
         global sound_enabled
@@ -42,22 +119,24 @@ class SoundManager:
 
         if sound_enabled:
             # Resume background music if enabled
-            if not pygame.mixer.music.get_busy():  # Check if music is already playing
-                self.play_music()
+            self.play_music()
         else:
-            # Stop background music if disabled
-            pygame.mixer.music.stop()
+            # Pause background music if disabled, it carries on from the same place when sound comes back
+            self.music.pause()
 
         print("Sound Enabled:", sound_enabled)
        
-    def play_music(self, assets_path='./assets/sounds'):
-        """Plays the background music on loop if sound is enabled."""
-        if self.music_playing:
-            pygame.mixer.music.load(f"{assets_path}/smooth-coffee.mp3")
-            pygame.mixer.music.play(loops=-1)  # Loop forever
+    def play_music(self):
+        """Plays the background music playlist, resuming where it was paused, or pauses it if music or sound is off."""
+        if self.music_playing and sound_enabled:
+            if self.music.is_paused():
+                self.music.resume()
+            elif self.music.track is None and self.music.queued is None:
+                self.music.play() # starts once the loader has decoded the track
             print("Background music started.")
         else:
-            pygame.mixer.music.stop()  # Stop the music
+            self.music.pause()
             print("Sound is disabled. Background music will not play.")
 
-
+# the game's sound manager, its effects are loaded by Game when the window opens
+sound_manager = SoundManager()
@@ -0,0 +1,57 @@
+'''
+Module Name: test_bignum.py
+Purpose: Tests that BigNums survive str, repr and parse unchanged and that non-finite values are refused
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import math
+import random
+
+import pytest
+
+from bignum import BigNum, fit
+
+# BigNums on both sides of the float range, including ones with every mantissa bit set
+def sample_numbers(count=2000, seed=3):
+    rng = random.Random(seed)
+    numbers = [BigNum(1.0), BigNum(-2.5), BigNum(0.0), BigNum(1e300) * 1e300, BigNum(math.nextafter(1.0, 0.0), 5000),
+               BigNum(0.7071067811865476, -1100)]
+    for _ in range(count):
+        mantissa = rng.uniform(0.5, 1.0) * rng.choice((1, -1))
+        numbers.append(BigNum(mantissa, rng.randint(-1100, 200000)))
+    return numbers
+
+def test_repr_round_trips_exactly():
+    for number in sample_numbers():
+        text = repr(number)
+        assert BigNum.parse(text).to_pair() == number.to_pair(), text
+        assert eval(text, {"BigNum": BigNum}).to_pair() == number.to_pair(), text
+
+def test_str_round_trips_exactly():
+    for number in sample_numbers():
+        assert BigNum.parse(str(number)).to_pair() == number.to_pair(), str(number)
+
+def test_parse_rounds_decimal_text_to_the_nearest_value():
+    assert BigNum.parse("1.5e400") == BigNum.parse("15e399")
+    assert str(BigNum.parse("1.5e400")) == "1.5e+400"
+    assert BigNum.parse("123.25") == 123.25
+    assert fit(BigNum.parse("1e308") / BigNum.parse("1e8")) == 1e300
+
+@pytest.mark.parametrize("value", [math.inf, -math.inf, math.nan, "inf", "-Infinity", "nan"])
+def test_non_finite_values_are_refused(value):
+    with pytest.raises(ValueError):
+        BigNum(value)
+
+@pytest.mark.parametrize("text", ["inf", "nan", "BigNum(inf, 3)", "BigNum(nan, 0)", "cookies"])
+def test_parse_refuses_non_finite_and_invalid_text(text):
+    with pytest.raises(ValueError):
+        BigNum.parse(text)
+
+def test_from_pair_refuses_non_finite_mantissas():
+    with pytest.raises(ValueError):
+        BigNum.from_pair((math.inf, 10))
@@ -0,0 +1,63 @@
+'''
+Module Name: test_number_format.py
+Purpose: Tests that the suffix table formats numbers the same way the old simplify_number did, up to the float range
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import math
+import sys
+
+from bignum import BigNum
+from number_format import NumberFormatter, SUFFIXES, LAST_ILLION
+
+# the suffix and formatting UIManager used before number_format.py, kept here as the reference
+def old_suffix(illion):
+    first_latin_units = ["m", "b", "tr", "quadr", "quint", "sext", "sept", "oct", "non"]
+    n_latin_units = ["un", "duo", "tre", "quattuor", "quin", "se", "septen", "octo", "novem"]
+    latin_tens = ["dec", "vigint", "trigint", "quadragint", "quinquagint", "sexagint", "septuagint", "octogint", "nonagint"]
+    if illion < 10:
+        return f"{first_latin_units[illion-1]}illion"
+    elif illion < 100:
+        digit_list = [int(digit) for digit in str(illion)]
+        if illion % 10 == 0:
+            return f"{latin_tens[digit_list[0]-1]}illion"
+        return f"{n_latin_units[digit_list[1]-1]}{latin_tens[digit_list[0]-1]}illion"
+    elif illion == 100:
+        return "centillion"
+    elif illion == 101:
+        return "uncentillion"
+
+def old_simplify_number(num):
+    if num < 1_000_000:
+        return f"{num:.1f}"
+    exponent = math.log10(num)
+    suffix_index = int(exponent // 3) - 1
+    scaled_num = num / (10 ** ((suffix_index + 1) * 3))
+    return f"{scaled_num:.3f} {old_suffix(suffix_index).capitalize()}"
+
+# numbers on both sides of every suffix boundary, up to the largest float
+def boundary_values():
+    values = [0.0, 999_999.9, 1_000_000.0, sys.float_info.max]
+    for power in range(6, 309, 3):
+        for mantissa in (1.0, 1.5, 9.999, 999.9994, 999.9996):
+            value = mantissa * 10.0 ** power
+            if math.isfinite(value):
+                values += [value, math.nextafter(value, 0.0)]
+    return values
+
+def test_suffixes_match_the_old_table():
+    assert LAST_ILLION == 101
+    assert SUFFIXES[1:] == [old_suffix(illion).capitalize() for illion in range(1, LAST_ILLION + 1)]
+
+def test_short_notation_matches_the_old_output_up_to_the_float_range():
+    formatter = NumberFormatter()
+    for value in boundary_values():
+        assert formatter.format(value) == old_simplify_number(value), value
+
+def test_bignums_past_the_table_use_scientific_notation():
+    assert NumberFormatter().format(BigNum.parse("1.5e400")).endswith("e+400")
@@ -0,0 +1,42 @@
+'''
+Module Name: test_rotation.py
+Purpose: Tests that the spinning cookie only blits pre-rendered frames once its first turn has been drawn
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import pygame
+
+import game # imported first, cookie.py and game.py import each other
+from cookie import Cookie, ROTATION_MEMORY_CAP
+
+def test_no_rotation_while_drawing_after_warm_up(monkeypatch):
+    pygame.init()
+    screen = pygame.display.set_mode((1920, 1080))
+    cookie = Cookie(f"{game.ASSETS_FILEPATH}/cookie.png", 0.2, 1920, 1080)
+    assert cookie.rotation_atlas.steps == 360 # one frame per degree the cookie turns
+    for _ in range(360): # warm-up: the first turn renders each frame once
+        cookie.draw(screen)
+        cookie.update_rotation()
+    assert cookie.rotation_atlas.memory_bytes() <= ROTATION_MEMORY_CAP
+
+    rotations = []
+    real_rotate = pygame.transform.rotate
+    monkeypatch.setattr(pygame.transform, "rotate", lambda *args: rotations.append(args) or real_rotate(*args))
+    for _ in range(720):
+        cookie.draw(screen)
+        cookie.update_rotation()
+    assert rotations == []
+
+def test_steps_shrink_to_an_even_divisor_when_a_turn_does_not_fit():
+    from assets import RotationAtlas
+    surface = pygame.Surface((768, 768), pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 255))
+    atlas = RotationAtlas(surface, 360, 64 * 1024 * 1024)
+    assert 360 % atlas.steps == 0 and atlas.steps < 360
+    atlas.prerender()
+    assert atlas.memory_bytes() <= 64 * 1024 * 1024
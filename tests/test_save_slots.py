@@ -0,0 +1,40 @@
+'''
+Module Name: test_save_slots.py
+Purpose: Tests that a save from before the slot index shows the same summary the game records after saving it
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+
+from economy import Economy
+from prestige import Prestige
+from save_format import encode
+from save_game import snapshot
+from save_slots import SaveSlotManager
+from save_writer import save_writer
+from shop import shop_items, shop_upgrades
+
+def test_legacy_slot_cps_matches_the_recorded_cps(tmp_path):
+    economy = Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades), Prestige())
+    economy.cookie_count = 1e12
+    for item in list(economy.shop_items.values())[:4]:
+        economy.apply_purchase(item, 3)
+    economy.prestige.prestige_count = 2
+    for key, upgrade in economy.prestige.get_shop_items():
+        upgrade.purchased_count = 1
+    economy.refresh_rates()
+    with open(tmp_path / "save1.txt", 'wb') as file:
+        file.write(encode(snapshot(economy)))
+
+    legacy = SaveSlotManager(str(tmp_path)).summary(1) # no index yet, the save file itself is summarized
+    recorder = SaveSlotManager(str(tmp_path / "recorded"))
+    recorder.record(str(tmp_path / "recorded" / "save1.txt"), economy)
+    save_writer.flush()
+    recorded = recorder.summary(1)
+    assert legacy["cps"] == recorded["cps"] == economy.cookies_per_second()
+    assert legacy["prestige_count"] == recorded["prestige_count"] == 2
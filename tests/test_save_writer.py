@@ -0,0 +1,76 @@
+'''
+Module Name: test_save_writer.py
+Purpose: Tests that a save survives the game dying partway through a snapshot write
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import copy
+import os
+
+from economy import Economy
+from load_game import load
+from save_format import encode
+from save_game import snapshot
+from save_writer import SaveWriter, backup_path, journal_path, read_journal, write_atomic
+from shop import shop_items, shop_upgrades
+
+def new_economy():
+    return Economy(copy.deepcopy(shop_items), copy.deepcopy(shop_upgrades))
+
+# Class for a writer that dies right after the snapshot is renamed into place, before its journal is emptied
+class CrashingWriter(SaveWriter):
+    def empty_journal(self, path):
+        raise RuntimeError("killed before the journal was emptied")
+
+def test_journal_left_by_a_crash_is_not_replayed_twice(tmp_path):
+    path = str(tmp_path / "save.bin")
+    economy = new_economy()
+    farm = economy.shop_items["Farm"]
+    economy.cookie_count = farm.base_cost
+    writer = CrashingWriter()
+    writer.submit_snapshot(path, encode(snapshot(economy)))
+    writer.flush()
+
+    economy.apply_purchase(farm, 1)
+    writer.submit_purchase(path, farm.name, 1, economy.cookie_count)
+    writer.submit_snapshot(path, encode(snapshot(economy)))
+    writer.flush()
+    assert isinstance(writer.last_error, RuntimeError)
+    assert len(read_journal(path)) == 1 # the crash left the purchase in the journal next to a snapshot that has it
+
+    loaded = new_economy()
+    assert load(loaded, path)
+    assert loaded.shop_items["Farm"].purchased_count == 1
+    assert loaded.cookies_per_second() == economy.cookies_per_second()
+
+def test_purchases_after_the_snapshot_are_replayed(tmp_path):
+    path = str(tmp_path / "save.bin")
+    economy = new_economy()
+    farm = economy.shop_items["Farm"]
+    economy.cookie_count = farm.base_cost * 10
+    writer = SaveWriter()
+    writer.submit_snapshot(path, encode(snapshot(economy)))
+    economy.apply_purchase(farm, 1)
+    writer.submit_purchase(path, farm.name, 1, economy.cookie_count)
+    writer.flush()
+
+    loaded = new_economy()
+    assert load(loaded, path)
+    assert loaded.shop_items["Farm"].purchased_count == 1
+
+def test_save_file_is_never_missing_while_backups_rotate(tmp_path):
+    path = str(tmp_path / "save.bin")
+    write_atomic(path, b"first")
+    inode = os.stat(path).st_ino
+    write_atomic(path, b"second")
+    with open(backup_path(path, 1), 'rb') as file:
+        assert file.read() == b"first"
+    with open(path, 'rb') as file:
+        assert file.read() == b"second"
+    assert not os.path.exists(journal_path(path))
+    assert inode != os.stat(path).st_ino # the new save was renamed in, the old one only gained a second name
@@ -0,0 +1,94 @@
+'''
+Module Name: widgets.py
+Purpose: Retained popups whose buttons are built once, laid out once per window size and hit-tested from click events
+Inputs: None
+Output: None
+Additional code sources:
+Developers: Ian Wilson, Andrew Uriell, Peter Pham, Jack Youngquist
+Date: 10/17/2026
+Last Modified: 10/17/2026
+'''
+
+import pygame
+from buttons import LargeButton
+from fonts import get_font, render_text
+
+GRAY = (200, 200, 200)
+BLACK = (0, 0, 0)
+
+# Class for a row of buttons along the bottom of a popup
+class ButtonRow:
+    def __init__(self, labels, width=0.2, height=0.1, bottom_margin=10, arrange="spread"):
+        self.labels = list(labels)
+        self.width = width # button width as a fraction of the popup width
+        self.height = height # button height as a fraction of the popup height
+        self.bottom_margin = bottom_margin # pixels between the bottom of the popup and the buttons
+        self.arrange = arrange # "spread" spaces the buttons evenly, "center" groups them in the middle
+        self.buttons = [] # (label, LargeButton), rebuilt only by layout
+
+    def layout(self, screen, popup_rect):
+        button_width = int(popup_rect.width * self.width)
+        button_height = int(popup_rect.height * self.height)
+        button_y = popup_rect.y + popup_rect.height - button_height - self.bottom_margin
+        count = len(self.labels)
+        if self.arrange == "center":
+            gap = 20
+            start_x = popup_rect.x + popup_rect.width // 2 - (count * button_width + (count - 1) * gap) // 2
+            positions = [start_x + index * (button_width + gap) for index in range(count)]
+        else:
+            spacing = (popup_rect.width - count * button_width) // (count + 1) # Space between buttons
+            positions = [popup_rect.x + (index + 1) * spacing + index * button_width for index in range(count)]
+        self.buttons = [(label, LargeButton(screen, x, button_y, label, button_width, button_height)) for label, x in zip(self.labels, positions)]
+
+# Class for a popup panel with a title, optional content and rows of buttons
+class Popup:
+    def __init__(self, title, rows, on_click, size=(0.7, 1.0), anchor="right", border=0, draw_content=None):
+        self.title = title
+        self.rows = rows
+        self.on_click = on_click # called with the label of the clicked button
+        self.size = size # (width, height) as fractions of the window
+        self.anchor = anchor # "right" sits against the right edge, "center" centers the popup
+        self.border = border # border thickness in pixels, 0 for none
+        self.draw_content = draw_content # optional callback(screen, rect) for the popup's dynamic text
+        self.rect = None
+        self.title_font = None
+        self.screen = None
+        self.layout_size = None # window size the popup was last laid out for
+
+    def layout(self, screen, width, height):
+        """Computes the popup rect and builds its buttons, only needed when the window size changes."""
+        popup_width = int(width * self.size[0])
+        popup_height = int(height * self.size[1])
+        popup_x = width - popup_width if self.anchor == "right" else (width - popup_width) // 2
+        popup_y = (height - popup_height) // 2  # Center the popup vertically
+        self.rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
+        self.title_font = get_font(int(popup_height * 0.1))
+        for row in self.rows:
+            row.layout(screen, self.rect)
+        self.screen = screen
+        self.layout_size = (width, height)
+
+    def draw(self, screen, width, height):
+        if self.layout_size != (width, height) or self.screen is not screen:
+            self.layout(screen, width, height)
+        pygame.draw.rect(screen, GRAY, self.rect)
+        if self.border:
+            pygame.draw.rect(screen, BLACK, self.rect, self.border)
+        title_surface = render_text(self.title, self.title_font, BLACK)
+        screen.blit(title_surface, (self.rect.x + self.rect.width // 2 - title_surface.get_width() // 2, self.rect.y + 10))
+        if self.draw_content is not None:
+            self.draw_content(screen, self.rect)
+        for row in self.rows:
+            for label, button in row.buttons:
+                button.draw(screen)
+
+    def handle_click(self, mouse_pos):
+        """Runs the clicked button's action. Returns True if the click landed on the popup."""
+        if self.rect is None:
+            return False
+        for row in self.rows:
+            for label, button in row.buttons:
+                if button.is_clicked(mouse_pos):
+                    self.on_click(label)
+                    return True
+        return self.rect.collidepoint(mouse_pos)